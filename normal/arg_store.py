@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import typing as t
+from collections import OrderedDict
+
+from globus_compute_sdk.serialize import ComputeSerializer
+
+from .array_serializer import is_buffered, loads_buffered
+from .compression import decompress_payload
+
+logger = logging.getLogger(__name__)
+
+# payloads kept by each worker process, keyed by (store location, digest)
+_WORKER_CACHE_BYTES = int(os.environ.get("FUNCX_ARG_CACHE_BYTES", 1024 * 1024 * 1024))
+_worker_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+_worker_cache_size = 0
+_worker_cache_lock = threading.Lock()
+
+
+class DirectoryArgStore:
+    """Content-addressed store of serialized arguments in a directory
+
+    Payloads are written once, under the hex SHA-256 digest of their content,
+    to ``<root>/<first two digest characters>/<digest>``.  For workers to
+    resolve references, the directory must be visible to them under the same
+    path, as on a shared filesystem.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(os.path.expanduser(root))
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def digest(payload: str) -> str:
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self._path(digest))
+
+    def put(self, digest: str, payload: str) -> bool:
+        """Store payload under digest; returns False if it was already stored"""
+        path = self._path(digest)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write under a temporary name and rename, so that readers never see a
+        # partial payload and concurrent writers of the same digest are harmless
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return True
+
+    def get(self, digest: str) -> str:
+        with open(self._path(digest), encoding="utf-8") as f:
+            return f.read()
+
+
+def _fetch(location: str, digest: str) -> str:
+    global _worker_cache_size
+
+    key = (location, digest)
+    with _worker_cache_lock:
+        payload = _worker_cache.get(key)
+        if payload is not None:
+            _worker_cache.move_to_end(key)
+            return payload
+
+    payload = DirectoryArgStore(location).get(digest)
+    with _worker_cache_lock:
+        if key not in _worker_cache:
+            _worker_cache[key] = payload
+            _worker_cache_size += len(payload)
+            while _worker_cache_size > _WORKER_CACHE_BYTES and len(_worker_cache) > 1:
+                _, evicted = _worker_cache.popitem(last=False)
+                _worker_cache_size -= len(evicted)
+    return payload
+
+
+def resolve_ref(location: str, digest: str) -> t.Any:
+    """Load the argument stored under digest; runs where an ArgRef is unpickled
+
+    The payload is read from the store once per process and then served from
+    memory.  It is deserialized on every call, so that tasks sharing an
+    argument do not share (and mutate) one object.
+    """
+    payload = decompress_payload(_fetch(location, digest))
+    if is_buffered(payload):
+        return loads_buffered(payload)
+    return ComputeSerializer().deserialize(payload)
+
+
+class ArgRef:
+    """Reference to an argument held in a DirectoryArgStore
+
+    An ArgRef pickles as a call to ``resolve_ref``, so unpickling it on the
+    worker yields the original argument; the function never sees the
+    reference.  The worker needs this module importable.
+    """
+
+    __slots__ = ("location", "digest", "size")
+
+    def __init__(self, location: str, digest: str, size: int):
+        self.location = location
+        self.digest = digest
+        self.size = size
+
+    def __reduce__(self):
+        return resolve_ref, (self.location, self.digest)
+
+    def __repr__(self) -> str:
+        return f"ArgRef({self.digest[:12]}, {self.size}B)"
+
+
+def _is_immutable(value: t.Any) -> bool:
+    """Whether value, and everything it holds, can never change"""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(v) for v in value)
+    return False
+
+
+class DedupSerializer:
+    """Proxy around a ComputeSerializer that replaces large arguments by ArgRefs
+
+    When serializing an args tuple or kwargs dict, each argument whose
+    serialized form is at least ``threshold`` characters is written to the
+    store, if it is not there yet, and replaced by a reference.  Immutable
+    arguments (strings, bytes, and tuples or frozensets of such values) that
+    are the very same object as in a recent call reuse its reference without
+    being serialized again; any other argument is serialized on every call, so
+    that changes made to it in between are not lost.
+    """
+
+    def __init__(
+        self,
+        serializer: t.Any,
+        store: DirectoryArgStore,
+        threshold: int = 64 * 1024,
+        identity_cache_size: int = 128,
+    ):
+        """
+        Parameters
+        ----------
+        serializer: ComputeSerializer
+            The serializer of the arguments and of the stored payloads
+
+        store: DirectoryArgStore
+            Where the large arguments are written
+
+        threshold: int
+            Serialized size, in characters, from which an argument is stored
+
+        identity_cache_size: int
+            Number of recently stored immutable arguments remembered by identity
+        """
+        self._serializer = serializer
+        self.store = store
+        self.threshold = threshold
+        self.identity_cache_size = identity_cache_size
+
+        self._lock = threading.Lock()
+        self._uploaded: set[str] = set()
+        # id(obj) -> (obj, ref); obj is held so that its id is not reused
+        self._by_identity: OrderedDict[int, tuple[t.Any, ArgRef]] = OrderedDict()
+
+        self.refs_created = 0
+        self.uploads = 0
+        self.bytes_deduplicated = 0
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._serializer, name)
+
+    def _ref_for(self, value: t.Any) -> t.Any:
+        if value is None or isinstance(value, (bool, int, float, complex)):
+            return value
+        if isinstance(value, (str, bytes)) and len(value) < self.threshold * 3 // 4:
+            # base64 makes payloads about 4/3 the size of the raw data
+            return value
+
+        # a mutable argument may have changed since it was last stored, so
+        # only immutable ones are recognized by identity
+        immutable = _is_immutable(value)
+        if immutable:
+            with self._lock:
+                cached = self._by_identity.get(id(value))
+                if cached is not None and cached[0] is value:
+                    self._by_identity.move_to_end(id(value))
+                    self.bytes_deduplicated += cached[1].size
+                    return cached[1]
+
+        payload = self._serializer.serialize(value)
+        if len(payload) < self.threshold:
+            return value
+        digest = self.store.digest(payload)
+        ref = ArgRef(self.store.root, digest, len(payload))
+
+        # digests are only marked once written, so that no reference is handed
+        # out before its payload is in the store; a concurrent duplicate write
+        # is harmless
+        written = digest not in self._uploaded and self.store.put(digest, payload)
+        with self._lock:
+            self._uploaded.add(digest)
+            if written:
+                self.uploads += 1
+            else:
+                self.bytes_deduplicated += len(payload)
+            self.refs_created += 1
+            if immutable:
+                self._by_identity[id(value)] = (value, ref)
+                while len(self._by_identity) > self.identity_cache_size:
+                    self._by_identity.popitem(last=False)
+        return ref
+
+    def serialize(self, data: t.Any) -> str:
+        if type(data) is tuple:
+            data = tuple(self._ref_for(v) for v in data)
+        elif type(data) is dict:
+            data = {k: self._ref_for(v) for k, v in data.items()}
+        return self._serializer.serialize(data)
+
+    def stats(self) -> t.Dict[str, int]:
+        with self._lock:
+            return {
+                "refs_created": self.refs_created,
+                "uploads": self.uploads,
+                "bytes_deduplicated": self.bytes_deduplicated,
+            }
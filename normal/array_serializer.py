@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import logging
+import typing as t
+
+import dill
+
+logger = logging.getLogger(__name__)
+
+# Marks a payload pickled with out-of-band buffers.  Like the compression
+# header it has the width of the ComputeSerializer method identifiers.  It is
+# followed by the comma separated lengths of the base64 encoded segments and a
+# newline, then the segments themselves: the pickle stream first, then one
+# segment per out-of-band buffer.
+BUFFERS_HEADER = "ob\n"
+
+
+def is_buffered(payload: str) -> bool:
+    return payload.startswith(BUFFERS_HEADER)
+
+
+def dumps_buffered(data: t.Any) -> str | None:
+    """Pickle data with protocol 5, keeping array contents out of the pickle
+
+    Each contiguous array buffer is base64 encoded straight from the array's
+    memory, without first being copied into the pickle stream.  Returns None
+    when data holds no such buffer, so that the regular serializer can be used.
+    """
+    buffers: list[t.Any] = []
+    stream = dill.dumps(data, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return None
+    segments = [base64.b64encode(stream).decode("ascii")]
+    for buf in buffers:
+        segments.append(base64.b64encode(buf.raw()).decode("ascii"))
+    lengths = ",".join(str(len(s)) for s in segments)
+    return "".join([BUFFERS_HEADER, lengths, "\n", *segments])
+
+
+def loads_buffered(payload: str) -> t.Any:
+    """Unpickle a payload produced by dumps_buffered
+
+    Arrays are rebuilt with ``np.frombuffer`` on the decoded buffers rather
+    than copied out of them, so they are read-only; copy an array before
+    modifying it in place.
+    """
+    newline = payload.index("\n", len(BUFFERS_HEADER))
+    lengths = payload[len(BUFFERS_HEADER) : newline]
+    # slice the encoded segments out of one bytes copy of the payload, rather
+    # than copying each of them out of the str
+    body = memoryview(payload.encode("ascii"))[newline + 1 :]
+    segments, offset = [], 0
+    for length in map(int, lengths.split(",")):
+        segments.append(binascii.a2b_base64(body[offset : offset + length]))
+        offset += length
+    return dill.loads(segments[0], buffers=segments[1:])
+
+
+class ArrayBufferSerializer:
+    """Proxy around a ComputeSerializer that ships NumPy arrays out-of-band
+
+    Data holding contiguous NumPy arrays (or anything else exposing pickle
+    protocol 5 buffers) is pickled with the buffers kept out of the pickle
+    stream; this avoids the copies made by the default strategy, which pickles
+    the arrays' contents inline and then encodes the whole stream.  Other
+    data, and function code, goes through the wrapped serializer unchanged.
+
+    ``deserialize`` recognizes both kinds of payload.  Arrays it returns are
+    read-only views on the received data.  Endpoint workers must deserialize
+    through this class (or ``loads_buffered``) to read arguments sent this way.
+    """
+
+    def __init__(self, serializer: t.Any):
+        """
+        Parameters
+        ----------
+        serializer: ComputeSerializer
+            The serializer used for data without out-of-band buffers
+        """
+        self._serializer = serializer
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._serializer, name)
+
+    def serialize(self, data: t.Any) -> str:
+        if not callable(data):
+            try:
+                payload = dumps_buffered(data)
+            except Exception as e:
+                logger.debug(f"Out-of-band pickling failed, falling back: {e}")
+            else:
+                if payload is not None:
+                    return payload
+        return self._serializer.serialize(data)
+
+    def deserialize(self, payload: str) -> t.Any:
+        if is_buffered(payload):
+            return loads_buffered(payload)
+        return self._serializer.deserialize(payload)
+
+    def unpack_and_deserialize(self, packed_buffer: str) -> list[t.Any]:
+        """ComputeSerializer.unpack_and_deserialize, for buffered payloads too"""
+        unpacked = [
+            self.deserialize(buf)
+            for buf in self._serializer.unpack_buffers(packed_buffer)
+        ]
+        assert len(unpacked) == 3, f"Unpack expects 3 buffers, got {len(unpacked)}"
+        return unpacked
@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import time
+import typing as t
+
+import globus_sdk
+import requests
+from globus_compute_sdk.errors import TaskPending
+from globus_compute_sdk.sdk.web_client import FunctionRegistrationData
+
+from .batch import Batch
+from .client import RESULT_PAYLOAD_KEY, Client
+from .rate_limit import THROTTLE_STATUSES, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+# seconds before expiry from which the token may need renewing, so that the
+# authorizer is only called off the event loop
+_RENEW_MARGIN = 300
+
+# serialized result bytes from which unpacking is moved off the event loop
+_OFFLOAD_BYTES = 64 * 1024
+
+
+def _payload_bytes(statuses: t.Iterable[t.Dict]) -> int:
+    # size of the still serialized results among task table or service blocks
+    size = 0
+    for status in statuses:
+        payload = status.get(RESULT_PAYLOAD_KEY, status.get("result"))
+        if isinstance(payload, (str, bytes)):
+            size += len(payload)
+    return size
+
+
+class AsyncClient:
+    """asyncio interface to the Globus Compute service
+
+    Coroutines mirror Client.run, batch_run, get_batch_result, get_result and
+    register_function.  Requests go through one pooled aiohttp session, and at
+    most ``max_concurrency`` of them are outstanding at a time, so a single
+    event loop can drive a very large number of tasks without opening a
+    connection, or an asyncio task, per task.
+
+    Authentication, the local task table and result store, serialization,
+    batch chunking and rate limiting are those of a regular Client, which is
+    created from the keyword arguments unless one is passed in.  Errors are
+    raised as by the Client, e.g. GlobusAPIError for an error response, and
+    result store lookups and the unpacking of large results run in the
+    loop's default executor rather than on the event loop.  With a rate
+    limit, submission and status requests wait for their turn without blocking
+    the event loop, and throttled ones are retried up to ``throttle_retries``
+    times.
+
+    Use as an async context manager, or call ``close()`` when done::
+
+        async with AsyncClient() as ac:
+            task_ids = await ac.batch_run(batch)
+            results = await ac.get_batch_result(task_ids)
+    """
+
+    def __init__(
+        self,
+        client: Client | None = None,
+        *,
+        max_concurrency: int = 256,
+        max_connections: int = 64,
+        http_timeout: float | None = None,
+        throttle_retries: int = 3,
+        **client_kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        client: Client
+            Client providing authentication and local state.  Default: None (a
+            new Client is created from ``client_kwargs``)
+
+        max_concurrency: int
+            Maximum number of requests outstanding at once
+
+        max_connections: int
+            Size of the HTTP connection pool
+
+        http_timeout: float
+            Total timeout for any single request, in seconds.  None for no
+            timeout.
+
+        throttle_retries: int
+            Number of times a rate limited request answered with 429 or 503 is
+            sent again
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError as e:
+            raise ImportError("AsyncClient requires the 'aiohttp' package") from e
+
+        self.client = client if client is not None else Client(**client_kwargs)
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.http_timeout = http_timeout
+        self.throttle_retries = throttle_retries
+
+        self.base_url = str(self.client.web_client.base_url).rstrip("/") + "/"
+        self._session: t.Any = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._auth_lock: asyncio.Lock | None = None
+
+    @property
+    def session_task_group_id(self) -> str:
+        return self.client.session_task_group_id
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        import aiohttp
+
+        if self._session is None:
+            timeout = aiohttp.ClientTimeout(total=self.http_timeout)
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._auth_lock = asyncio.Lock()
+        return self._session
+
+    def _auth_headers(self) -> t.Dict[str, str]:
+        authorizer = getattr(self.client.web_client, "authorizer", None)
+        if authorizer is None:
+            return {}
+        header = authorizer.get_authorization_header()
+        return {"Authorization": header} if header else {}
+
+    @staticmethod
+    def _token_is_fresh(authorizer: t.Any) -> bool:
+        # well before globus_sdk would renew it on get_authorization_header
+        expires_at = getattr(authorizer, "expires_at", None)
+        return expires_at is not None and expires_at - time.time() > _RENEW_MARGIN
+
+    async def _in_executor(self, func: t.Callable[[], t.Any]) -> t.Any:
+        # authorizer calls may renew the token over HTTP; keep that off the
+        # event loop, and let only one coroutine at a time do it
+        assert self._auth_lock is not None
+        async with self._auth_lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, func)
+
+    @staticmethod
+    async def _offload(offload: bool, func: t.Callable[..., t.Any], *args) -> t.Any:
+        # run blocking local work (sqlite, deserialization) off the event loop
+        # when it may take long enough to matter
+        if not offload:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    async def _api_error(self, resp, method: str, url: str) -> Exception:
+        # the error the web client raises for the same response, so that both
+        # clients' callers handle the same exception types
+        r = requests.Response()
+        r.status_code = resp.status
+        r.headers.update(resp.headers)
+        r._content = await resp.read()
+        r.url = url
+        r.request = requests.Request(method, url).prepare()
+        error_class = getattr(
+            self.client.web_client, "error_class", globus_sdk.GlobusAPIError
+        )
+        return error_class(r)
+
+    async def _get_auth_headers(self) -> t.Dict[str, str]:
+        authorizer = getattr(self.client.web_client, "authorizer", None)
+        if authorizer is None or self._token_is_fresh(authorizer):
+            return self._auth_headers()
+        return await self._in_executor(self._auth_headers)
+
+    async def _request(
+        self, method: str, path: str, data: t.Any = None
+    ) -> t.Dict[str, t.Any]:
+        session = self._get_session()
+        url = self.base_url + path.lstrip("/")
+        assert self._semaphore is not None
+        route = path.strip("/").split("/")[0]
+        limiter = None
+        if route in ("submit", "tasks", "batch_status", "taskgroup"):
+            limiter = self.client.rate_limiter
+        async with self._semaphore:
+            metrics = self.client.metrics
+            if metrics is None:
+                return await self._send(session, method, url, data, limiter)
+            op = "async_" + route
+            start = time.perf_counter()
+            error = True
+            try:
+                result = await self._send(session, method, url, data, limiter)
+                error = False
+                return result
+            finally:
+                metrics.record_request(op, time.perf_counter() - start, error)
+
+    async def _send(self, session, method: str, url: str, data: t.Any, limiter=None):
+        reauthorized = False
+        throttled = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async()
+            headers = await self._get_auth_headers()
+            async with session.request(method, url, json=data, headers=headers) as resp:
+                authorizer = getattr(self.client.web_client, "authorizer", None)
+                if resp.status == 401 and not reauthorized and authorizer:
+                    # as globus_sdk does, give the authorizer one chance to
+                    # renew its token
+                    await self._in_executor(authorizer.handle_missing_authorization)
+                    reauthorized = True
+                    continue
+                if limiter is not None:
+                    if resp.status in THROTTLE_STATUSES:
+                        limiter.on_throttle(
+                            resp.status,
+                            retry_after_seconds(resp.headers.get("Retry-After")),
+                        )
+                        if throttled < self.throttle_retries:
+                            throttled += 1
+                            continue
+                    elif resp.status < 400:
+                        limiter.on_success()
+                if resp.status >= 400:
+                    raise await self._api_error(resp, method, url)
+                body = await resp.read()
+            return await self._offload(len(body) > _OFFLOAD_BYTES, json.loads, body)
+
+    def create_batch(self, task_group_id=None) -> Batch:
+        """Create a Batch instance; see Client.create_batch"""
+        return self.client.create_batch(task_group_id=task_group_id)
+
+    async def run(self, *args, endpoint_id=None, function_id=None, **kwargs) -> str:
+        """Submit a single invocation; returns the task UUID"""
+        assert endpoint_id is not None, "endpoint_id key-word argument must be set"
+        assert function_id is not None, "function_id key-word argument must be set"
+
+        batch = self.create_batch()
+        batch.add(function_id, endpoint_id, args, kwargs)
+        r = await self.batch_run(batch)
+        return r[0]
+
+    async def _submit_chunk(self, data: t.Dict[str, t.Any], chunk: t.List[t.Any]):
+        try:
+            return await self._request("POST", "submit", {**data, "tasks": chunk})
+        except Exception as e:
+            logger.warning(f"Submission of {len(chunk)} tasks failed: {e}")
+            return e
+
+    async def batch_run(self, batch: Batch) -> t.List[str]:
+        """Submit a Batch; see Client.batch_run for chunking and error handling"""
+        assert isinstance(batch, Batch), "Requires a Batch object as input"
+        assert len(batch.tasks) > 0, "Requires a non-empty batch"
+
+        data = batch.prepare()
+        chunks = self.client._chunk_tasks(data["tasks"])
+        responses = await asyncio.gather(
+            *(self._submit_chunk(data, chunk) for chunk in chunks)
+        )
+
+        return self.client._unpack_submit_responses(chunks, responses)
+
+    async def _get_batch_status(self, task_id_list: t.List[str]) -> t.Dict:
+        page_size = self.client.batch_status_page_size or len(task_id_list) or 1
+        pages = await asyncio.gather(
+            *(
+                self._request(
+                    "POST",
+                    "batch_status",
+                    {"task_ids": task_id_list[i : i + page_size]},
+                )
+                for i in range(0, len(task_id_list), page_size)
+            )
+        )
+        results: t.Dict[str, t.Any] = {}
+        for page in pages:
+            results.update(page["results"])
+        return results
+
+    async def get_batch_result(
+        self, task_id_list: t.List[str], status_only: bool = False
+    ) -> t.Dict[str, t.Dict]:
+        """Request status for a batch of task_ids; see Client.get_batch_result"""
+        assert isinstance(
+            task_id_list, list
+        ), "get_batch_result expects a list of task ids"
+
+        client = self.client
+        stored = client.result_store is not None
+        cached = await self._offload(stored, client._lookup_completed, task_id_list)
+        pending_task_ids = [tid for tid in task_id_list if tid not in cached]
+        status_data = {}
+        if pending_task_ids:
+            status_data = await self._get_batch_status(pending_task_ids)
+
+        large = not status_only and (
+            _payload_bytes(cached.values()) + _payload_bytes(status_data.values())
+            > _OFFLOAD_BYTES
+        )
+        return await self._offload(
+            stored or large,
+            self._unpack_batch_result,
+            task_id_list,
+            cached,
+            status_data,
+            status_only,
+        )
+
+    def _unpack_batch_result(
+        self,
+        task_id_list: t.List[str],
+        cached: t.Dict[str, t.Dict],
+        status_data: t.Dict[str, t.Any],
+        status_only: bool,
+    ) -> t.Dict[str, t.Dict]:
+        client = self.client
+        results = {}
+        for task_id in task_id_list:
+            status = cached.get(task_id)
+            data = None if status is not None else status_data.get(task_id)
+            if status is None and data is None:
+                continue
+            try:
+                if status is None:
+                    status = client._update_task_table(data, task_id)
+                if status_only:
+                    results[task_id] = client._status_only(status)
+                else:
+                    results[task_id] = client._deserialize_result(status)
+            except Exception:
+                logger.exception("Failure while unpacking results fom get_batch_result")
+        return results
+
+    async def get_result(self, task_id: str) -> t.Any:
+        """Get the result of a task; see Client.get_result"""
+        client = self.client
+        stored = client.result_store is not None
+        found = await self._offload(stored, client._lookup_completed, [task_id])
+        status = found.get(task_id)
+        if status is None:
+            data = await self._request("GET", f"tasks/{task_id}")
+            large = _payload_bytes([data]) > _OFFLOAD_BYTES
+            status = await self._offload(
+                stored or large, client._update_task_table, data, task_id
+            )
+        if status["pending"] is True:
+            raise TaskPending(status["status"])
+        large = _payload_bytes([status]) > _OFFLOAD_BYTES
+        status = await self._offload(large, client._deserialize_result, status)
+        return status["result"]
+
+    async def register_function(
+        self,
+        function,
+        function_name=None,
+        container_uuid=None,
+        description=None,
+        public=False,
+        group=None,
+    ) -> str:
+        """Register a function; see Client.register_function"""
+        data = FunctionRegistrationData(
+            function=function,
+            container_uuid=container_uuid,
+            entry_point=function_name,
+            description=description,
+            public=public,
+            group=group,
+            serializer=self.client.fx_serializer,
+        )
+        cache = self.client.function_cache
+        cache_key = None
+        if cache is not None:
+            cache_key = self.client._function_cache_key(data.to_dict())
+            function_uuid = cache.get(cache_key)
+            if function_uuid is not None:
+                return function_uuid
+
+        logger.info(f"Registering function : {data}")
+        r = await self._request("POST", "functions", data.to_dict())
+        function_uuid = r["function_uuid"]
+        if cache_key is not None:
+            cache.put(cache_key, function_uuid)
+        return function_uuid
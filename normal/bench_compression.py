@@ -0,0 +1,64 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from globus_compute_sdk.sdk.compression import (
+    available_algorithms,
+    compress_payload,
+    decompress_payload,
+)
+from globus_compute_sdk.serialize import ComputeSerializer
+
+# Benchmark payload compression: bytes saved against the CPU spent compressing
+# and decompressing, for each available algorithm and a few payload shapes
+# resembling our task arguments and results.  Sizes are those of the serialized
+# payload before and after compression, as sent to the service.
+
+parser = argparse.ArgumentParser(description="serialized payload compression")
+parser.add_argument("--size", type=int, default=8 * 1024 * 1024, help="bytes")
+parser.add_argument("--repeat", type=int, default=5)
+parser.add_argument("--algorithms", default=",".join(available_algorithms()))
+parser.add_argument("--levels", default="", help="e.g. 1,6,9; codec default if empty")
+args = parser.parse_args()
+
+n = args.size
+rng = np.random.default_rng(0)
+job = {"base_path": "/srv/panda", "data_path": "/srv/data", "cores": 8}
+payloads = {
+    "json": json.dumps([dict(job, index=i) for i in range(n // 64)])[:n],
+    "sparse_voxels": np.where(
+        rng.random(n // 4) < 0.05, rng.random(n // 4), 0.0
+    ).astype(np.float32),
+    "random_floats": rng.random(n // 8),
+    "random_bytes": os.urandom(n),
+}
+levels = [int(x) for x in args.levels.split(",") if x] or [None]
+
+plain = ComputeSerializer()
+print(
+    f"{'payload':15s} {'algorithm':9s} {'level':>5s} {'serialized':>11s}"
+    f" {'sent':>11s} {'saved':>6s} {'comp ms':>8s} {'decomp ms':>9s}"
+)
+for name, data in payloads.items():
+    baseline = plain.serialize(data)
+    for algorithm in args.algorithms.split(","):
+        for level in levels:
+            comp_t = decomp_t = 0.0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                sent = compress_payload(baseline, algorithm, level)
+                comp_t += time.perf_counter() - start
+                start = time.perf_counter()
+                decompress_payload(sent)
+                decomp_t += time.perf_counter() - start
+            comp_ms = comp_t / args.repeat * 1000
+            decomp_ms = decomp_t / args.repeat * 1000
+
+            saved = 1 - len(sent) / len(baseline)
+            print(
+                f"{name:15s} {algorithm:9s} {str(level):>5s} {len(baseline):11d}"
+                f" {len(sent):11d} {saved:6.1%} {comp_ms:8.1f} {decomp_ms:9.1f}"
+            )
@@ -0,0 +1,76 @@
+import argparse
+import os
+import time
+import uuid
+
+from globus_compute_sdk import Client
+from globus_compute_sdk.sdk.client import RESULT_PAYLOAD_KEY
+from globus_compute_sdk.serialize import ComputeSerializer
+
+# Benchmark get_batch_result deserialization: serial vs thread pool vs process
+# pool, over synthetic completed-task payloads of varying size.
+# No service is contacted; the web client is replaced by a canned responder.
+
+parser = argparse.ArgumentParser(description="get_batch_result deserialization")
+parser.add_argument("--tasks", type=int, default=2000)
+parser.add_argument("--sizes", default="1024,65536,1048576,4194304")
+parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+parser.add_argument("--threshold", type=int, default=64 * 1024)
+args = parser.parse_args()
+
+
+class CannedWebClient:
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def get_batch_status(self, task_ids):
+        return {"results": {tid: self.statuses[tid] for tid in task_ids}}
+
+
+class CannedLoginManager:
+    def __init__(self, web_client):
+        self.web_client = web_client
+
+    def get_web_client(self, base_url=None, app_name=None):
+        return self.web_client
+
+
+serializer = ComputeSerializer()
+sizes = [int(s) for s in args.sizes.split(",")]
+statuses = {}
+for i in range(args.tasks):
+    size = sizes[i % len(sizes)]
+    payload = serializer.serialize({"index": i, "data": os.urandom(size)})
+    statuses[str(uuid.uuid4())] = {
+        "status": "success",
+        "result": payload,
+        "completion_t": str(time.time()),
+    }
+task_ids = list(statuses)
+total_mb = sum(len(s["result"]) for s in statuses.values()) / 2**20
+print(f"{args.tasks} results, sizes {sizes}, {total_mb:.1f} MiB serialized")
+
+modes = [("serial", 0, "thread")]
+modes.append(("thread", args.workers, "thread"))
+modes.append(("process", args.workers, "process"))
+for name, workers, pool in modes:
+    fxc = Client(
+        login_manager=CannedLoginManager(CannedWebClient(statuses)),
+        do_version_check=False,
+        deserialize_workers=workers,
+        deserialize_pool=pool,
+        deserialize_threshold=args.threshold,
+        task_cache_bytes=None,
+    )
+    if workers:
+        # warm the pool up so worker start-up is not counted
+        warm_up = {RESULT_PAYLOAD_KEY: statuses[task_ids[0]]["result"]}
+        fxc._deserialize_in_pool([(task_ids[0], warm_up)])
+    start = time.perf_counter()
+    results = fxc.get_batch_result(task_ids)
+    elapsed = time.perf_counter() - start
+    assert len(results) == len(task_ids)
+    print(
+        f"{name:8s} workers={workers:3d}  {elapsed:8.3f}s"
+        f"  {args.tasks / elapsed:10.1f} results/s  {total_mb / elapsed:8.1f} MiB/s"
+    )
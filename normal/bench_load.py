@@ -0,0 +1,144 @@
+import argparse
+import logging
+import multiprocessing
+import resource
+import time
+import uuid
+
+from globus_compute_sdk import Client
+from globus_compute_sdk.errors import TaskExecutionFailed
+from globus_compute_sdk.sdk.fake_service import FakeComputeService
+from globus_compute_sdk.sdk.web_client import WebClient
+
+# Load test of the Client against a local fake of the web service: submit N
+# tasks with batch_run, then poll them with get_batch_result until all are
+# complete, for each N given.  Reports submissions/s, polls/s (batch status
+# requests) and the client's CPU time and memory.  The fake service runs in a
+# child process, so that its work is not counted as the client's.
+
+parser = argparse.ArgumentParser(description="Client load test")
+parser.add_argument("--tasks", default="1000,10000,100000")
+parser.add_argument("--latency", type=float, default=0.02)
+parser.add_argument("--latency-jitter", type=float, default=0.01)
+parser.add_argument("--failure-rate", type=float, default=0.0)
+parser.add_argument("--task-duration", type=float, default=1.0)
+parser.add_argument("--task-duration-jitter", type=float, default=2.0)
+parser.add_argument("--task-failure-rate", type=float, default=0.0)
+parser.add_argument("--poll-interval", type=float, default=0.5)
+parser.add_argument("--chunk-size", type=int, default=1000)
+parser.add_argument("--submit-workers", type=int, default=4)
+parser.add_argument("--status-page-size", type=int, default=1000)
+parser.add_argument("--status-workers", type=int, default=4)
+parser.add_argument("--verbose", action="store_true")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.DEBUG if args.verbose else logging.CRITICAL)
+
+
+class LocalLoginManager:
+    def __init__(self, url):
+        self.url = url
+
+    def get_web_client(self, base_url=None, app_name=None):
+        return WebClient(base_url=self.url)
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def rss_mib() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * resource.getpagesize() / 2**20
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def serve(conn) -> None:
+    service = FakeComputeService(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        failure_rate=args.failure_rate,
+        task_duration=args.task_duration,
+        task_duration_jitter=args.task_duration_jitter,
+        task_failure_rate=args.task_failure_rate,
+    ).start()
+    conn.send(service.url)
+    conn.recv()  # wait until told to stop
+    conn.send(service.stats())
+    service.stop()
+
+
+conn, child_conn = multiprocessing.Pipe()
+service_process = multiprocessing.Process(target=serve, args=(child_conn,))
+service_process.start()
+url = conn.recv()
+
+print(
+    f"{'tasks':>8s} {'build s':>8s} {'submit s':>8s} {'subs/s':>9s} {'poll s':>7s}"
+    f" {'polls':>6s} {'polls/s':>8s} {'fail':>5s} {'cpu s':>7s} {'rss MiB':>8s}"
+    f" {'peak MiB':>8s}"
+)
+function_id, endpoint_id = str(uuid.uuid4()), str(uuid.uuid4())
+for n in [int(x) for x in args.tasks.split(",")]:
+    fxc = Client(
+        login_manager=LocalLoginManager(url),
+        do_version_check=False,
+        submit_chunk_size=args.chunk_size,
+        submit_workers=args.submit_workers,
+        batch_status_page_size=args.status_page_size,
+        batch_status_workers=args.status_workers,
+        task_cache_size=None,
+        instrument=True,
+    )
+    cpu_start = cpu_seconds()
+
+    start = time.perf_counter()
+    batch = fxc.create_batch()
+    for i in range(n):
+        batch.add(function_id, endpoint_id, (i,))
+    build_t = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        task_ids = fxc.batch_run(batch)
+    except TaskExecutionFailed as e:
+        task_ids = [tid for tid in e.task_uuids if tid is not None]
+    submit_t = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pending, failed = set(task_ids), 0
+    while pending:
+        try:
+            results = fxc.get_batch_result(list(pending), status_only=True)
+        except Exception:
+            # a failed status request; poll again
+            results = None
+        if results is not None:
+            for task_id in list(pending):
+                status = results.get(task_id)
+                if status is None:
+                    # tasks that failed are left out of get_batch_result
+                    pending.discard(task_id)
+                    failed += 1
+                elif not status["pending"]:
+                    pending.discard(task_id)
+        if pending:
+            time.sleep(args.poll_interval)
+    poll_t = time.perf_counter() - start
+    polls = fxc.metrics.as_dict()["requests"]["get_batch_status"]["count"]
+
+    print(
+        f"{n:8d} {build_t:8.2f} {submit_t:8.2f} {len(task_ids) / submit_t:9.0f}"
+        f" {poll_t:7.2f} {polls:6d} {polls / poll_t:8.1f} {failed:5d}"
+        f" {cpu_seconds() - cpu_start:7.2f} {rss_mib():8.1f} {peak_rss_mib():8.1f}"
+    )
+
+conn.send("stop")
+print(conn.recv())
+service_process.join()
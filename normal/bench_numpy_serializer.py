@@ -0,0 +1,57 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from globus_compute_sdk.sdk.array_serializer import ArrayBufferSerializer
+from globus_compute_sdk.serialize import ComputeSerializer
+
+# Benchmark NumPy array serialization: the default strategy (dill pickle,
+# base64 encoded inline) against pickle protocol 5 out-of-band buffers.
+# Reports time and peak Python-tracked memory of each direction; the peak
+# approximates the number of transient copies of the array contents.
+
+parser = argparse.ArgumentParser(description="NumPy array serialization")
+parser.add_argument("--mb", type=int, default=100, help="array size in MiB")
+parser.add_argument("--repeat", type=int, default=3)
+parser.add_argument("--dtype", default="float32")
+args = parser.parse_args()
+
+n = args.mb * 2**20 // np.dtype(args.dtype).itemsize
+data = {
+    "energies": np.random.default_rng(0).random(n).astype(args.dtype),
+    "event": 42,
+}
+print(f"array: {data['energies'].nbytes / 2**20:.0f} MiB of {args.dtype}")
+
+
+def measure(fn, *fn_args):
+    best, peak, out = float("inf"), 0, None
+    for _ in range(args.repeat):
+        out = None
+        tracemalloc.start()
+        start = time.perf_counter()
+        out = fn(*fn_args)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return out, best, peak
+
+
+strategies = [
+    ("default", ComputeSerializer()),
+    ("out-of-band", ArrayBufferSerializer(ComputeSerializer())),
+]
+print(
+    f"{'strategy':12s} {'payload MiB':>11s} {'ser s':>7s} {'ser peak MiB':>12s}"
+    f" {'deser s':>7s} {'deser peak MiB':>14s}"
+)
+for name, serializer in strategies:
+    payload, ser_t, ser_peak = measure(serializer.serialize, data)
+    result, deser_t, deser_peak = measure(serializer.deserialize, payload)
+    assert np.array_equal(result["energies"], data["energies"])
+    print(
+        f"{name:12s} {len(payload) / 2**20:11.1f} {ser_t:7.3f}"
+        f" {ser_peak / 2**20:12.1f} {deser_t:7.3f} {deser_peak / 2**20:14.1f}"
+    )
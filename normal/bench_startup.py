@@ -0,0 +1,71 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Benchmark the start-up cost of a short-lived script: importing the SDK and
+# constructing a Client, each measured in a fresh interpreter.  The version
+# check goes to a canned web client that sleeps for --version-latency seconds,
+# standing in for the round trip to the service; login is skipped.
+
+parser = argparse.ArgumentParser(description="Client start-up time")
+parser.add_argument("--runs", type=int, default=10)
+parser.add_argument("--version-latency", type=float, default=0.15)
+args = parser.parse_args()
+
+SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+from globus_compute_sdk import Client
+t1 = time.perf_counter()
+
+class CannedWebClient:
+    def get_version(self):
+        time.sleep({latency})
+        return {{"min_ep_version": "0.0.1", "min_sdk_version": "0.0.1"}}
+
+class CannedLoginManager:
+    def get_web_client(self, base_url=None, app_name=None):
+        return CannedWebClient()
+
+Client(
+    login_manager=CannedLoginManager(),
+    funcx_home={home!r},
+    version_check_ttl={ttl},
+)
+t2 = time.perf_counter()
+print(json.dumps({{
+    "import": t1 - t0,
+    "construct": t2 - t1,
+    "asyncio_imported": "globus_compute_sdk.sdk.asynchronous.ws_polling_task"
+    in sys.modules,
+}}))
+"""
+
+
+def run(home: str, ttl: float | None) -> dict:
+    script = SCRIPT.format(latency=args.version_latency, home=home, ttl=ttl)
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def report(name: str, samples: list[dict]) -> None:
+    imp = statistics.median(s["import"] for s in samples) * 1000
+    con = statistics.median(s["construct"] for s in samples) * 1000
+    ws = any(s["asyncio_imported"] for s in samples)
+    print(
+        f"{name:28s} import {imp:7.1f} ms  construct {con:7.1f} ms"
+        f"  total {imp + con:7.1f} ms  websocket imported: {ws}"
+    )
+
+
+with tempfile.TemporaryDirectory() as home:
+    run(home, None)  # warm the OS file cache
+    report("no version cache", [run(home, None) for _ in range(args.runs)])
+    first = run(home, 3600)
+    report("version cache, first run", [first])
+    report("version cache, later runs", [run(home, 3600) for _ in range(args.runs)])
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-import asyncio
+import atexit
+import functools
 import getpass
 import json
 import logging
 import os
 import typing as t
 import tempfile
+import threading
+import time
 import uuid
 import warnings
+import weakref
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+)
 
+import globus_sdk
 from globus_compute_sdk.errors import (
     SerializationError,
     TaskExecutionFailed,
@@ -20,17 +33,46 @@ from globus_compute_sdk.sdk._environments import (
     get_web_socket_url,
     urls_might_mismatch,
 )
-from globus_compute_sdk.sdk.asynchronous.compute_task import ComputeTask
-from globus_compute_sdk.sdk.asynchronous.ws_polling_task import WebSocketPollingTask
 from globus_compute_sdk.sdk.web_client import FunctionRegistrationData
 from globus_compute_sdk.serialize import ComputeSerializer
 from globus_compute_sdk.version import __version__, compare_versions
 
+from .arg_store import DedupSerializer, DirectoryArgStore
+from .array_serializer import ArrayBufferSerializer, is_buffered, loads_buffered
 from .batch import Batch
-from .login_manager import LoginManager, LoginManagerProtocol, requires_login
+from .compression import CompressingSerializer, decompress_payload
+from .endpoint_cache import StaleWhileRevalidateCache
+from .function_cache import FunctionRegistrationCache
+from .instrumentation import (
+    ClientMetrics,
+    InstrumentedSerializer,
+    InstrumentedWebClient,
+)
+from .login_manager import (
+    ComputeScopes,
+    LoginManager,
+    LoginManagerProtocol,
+    requires_login,
+)
+from .login_manager.tokenstore import (
+    TokenRefresher,
+    _resolve_namespace,
+    get_token_refresher,
+)
+from .polling import PollScheduler
+from .rate_limit import RateLimitedWebClient, RateLimiter
+from .result_poller import ResultPoller
+from .result_store import ResultStore
+from .router import EndpointRouter
+from .submitter import CoalescingSubmitter
+from .task_cache import TaskStatusCache
 
 logger = logging.getLogger(__name__)
 
+# key under which a completed task's still-serialized result is kept
+RESULT_PAYLOAD_KEY = "result_payload"
+
+
 g_home = os.environ.get("GLOBUS_COMPUTE_HOME", None)
 if g_home:
     if not os.path.exists(g_home):
@@ -52,6 +94,32 @@ else:
     # print("_FUNCX_HOME", _FUNCX_HOME)
 
 
+def _deserialize_payload(payload: str) -> t.Any:
+    # module level so that it can be shipped to a process pool
+    payload = decompress_payload(payload)
+    if is_buffered(payload):
+        return loads_buffered(payload)
+    return ComputeSerializer().deserialize(payload)
+
+
+def _close_at_exit(client_ref: weakref.ref) -> None:
+    # a weak reference, so that the atexit registry does not keep clients alive
+    client = client_ref()
+    if client is not None:
+        client.close()
+
+
+class DoneAndNotDoneTasks(t.NamedTuple):
+    done: t.Set[str]
+    not_done: t.Set[str]
+
+
+class WhitelistUpdate(t.NamedTuple):
+    added: t.List[str]
+    removed: t.List[str]
+    errors: t.Dict[str, Exception]
+
+
 class Client:
     """Main class for interacting with the Globus Compute service
 
@@ -83,6 +151,41 @@ class Client:
         fx_authorizer: t.Any = None,
         *,
         login_manager: LoginManagerProtocol | None = None,
+        task_cache_size: int | None = 100_000,
+        task_cache_bytes: int | None = 512 * 1024 * 1024,
+        task_cache_ttl: float | None = None,
+        batch_status_page_size: int = 1000,
+        batch_status_workers: int = 4,
+        deserialize_workers: int = 0,
+        deserialize_pool: str = "thread",
+        deserialize_threshold: int = 1024 * 1024,
+        result_store: bool | str = False,
+        result_store_bytes: int | None = 4 * 1024 * 1024 * 1024,
+        function_cache: bool = False,
+        function_cache_ttl: float | None = None,
+        coalesce_run: bool = False,
+        coalesce_max_batch: int = 100,
+        coalesce_max_delay: float = 0.05,
+        future_poll_interval: float = 0.1,
+        future_max_poll_interval: float = 10.0,
+        submit_chunk_size: int = 1000,
+        submit_chunk_bytes: int | None = 8 * 1024 * 1024,
+        submit_workers: int = 2,
+        whitelist_workers: int = 8,
+        endpoint_cache_ttl: float | None = None,
+        endpoint_cache_max_stale: float = 60.0,
+        instrument: bool = False,
+        compression: str | None = None,
+        compression_threshold: int = 64 * 1024,
+        compression_level: int | None = None,
+        numpy_buffers: bool = False,
+        arg_store: str | None = None,
+        arg_store_threshold: int = 64 * 1024,
+        version_check_ttl: float | None = 3600.0,
+        token_refresh: bool = False,
+        token_refresh_lead_time: float = 300.0,
+        rate_limit: float | RateLimiter | None = None,
+        rate_limit_burst: float | None = None,
         **kwargs,
     ):
         """
@@ -141,6 +244,206 @@ class Client:
             session or to reestablish Executor futures.
             Default: None (will be auto generated)
 
+        task_cache_size: int
+            Maximum number of task status blocks kept in the local task table.
+            Least recently used entries are evicted first.  None for no limit.
+            Default: 100000
+
+        task_cache_bytes: int
+            Maximum total size, in bytes, of the serialized results kept in the
+            local task table.  None for no limit.
+            Default: 512 MiB
+
+        task_cache_ttl: float
+            Seconds after which a cached task status is dropped and refetched
+            from the service.  None for no expiry.
+            Default: None
+
+        batch_status_page_size: int
+            Maximum number of task ids sent in a single batch status request.
+            Longer lists are split into pages.
+            Default: 1000
+
+        batch_status_workers: int
+            Number of batch status pages requested concurrently.
+            Default: 4
+
+        deserialize_workers: int
+            Number of pool workers used by get_batch_result to deserialize large
+            results in parallel.  0 deserializes everything in the calling
+            thread.
+            Default: 0
+
+        deserialize_pool: str
+            Kind of pool used for parallel deserialization, "thread" or
+            "process".  A process pool sidesteps the GIL but pickles every
+            result back to the client, which unpickles it again; it only pays
+            off for results that are slow to rebuild and cheap to pickle, on
+            several cores.  The pool is shut down by close().
+            Default: "thread"
+
+        deserialize_threshold: int
+            Serialized size, in bytes, from which a result is handed to the pool.
+            Default: 1 MiB
+
+        result_store: bool | str
+            Keep completed results in an SQLite database so that they survive a
+            restart of the client and are served without contacting the
+            service.  True places the database at <funcx_home>/results.db; a
+            string gives its path.
+            Default: False
+
+        result_store_bytes: int
+            Maximum total size of the results kept in the result store; least
+            recently used results are evicted beyond it.  None for no limit.
+            Default: 4 GiB
+
+        function_cache: bool
+            Remember function registrations in <funcx_home>/functions.db, keyed
+            by a hash of the serialized function, its container and settings,
+            and the service address.  Registering an identical function again
+            then returns the known function UUID without contacting the
+            service.
+            Default: False
+
+        function_cache_ttl: float
+            Seconds after which a cached registration is ignored and the
+            function is registered again.  None for no expiry.
+            Default: None
+
+        coalesce_run: bool
+            Buffer run() calls and submit them together through batch_run.
+            run() then returns a concurrent.futures.Future resolving to the
+            task UUID instead of the UUID itself.  Not available together with
+            asynchronous.
+            Default: False
+
+        coalesce_max_batch: int
+            Number of buffered run() calls that triggers a submission.
+            Default: 100
+
+        coalesce_max_delay: float
+            Longest time, in seconds, a run() call is buffered.
+            Default: 0.05
+
+        future_poll_interval: float
+            Minimum delay between the polls resolving the Futures returned by
+            submit_future, batch_run_futures and get_futures.
+            Default: 0.1
+
+        future_max_poll_interval: float
+            Maximum delay between those polls.
+            Default: 10
+
+        submit_chunk_size: int
+            Maximum number of tasks sent in a single submission by batch_run.
+            Default: 1000
+
+        submit_chunk_bytes: int
+            Maximum serialized size, in bytes, of the tasks sent in a single
+            submission by batch_run.  None for no limit.
+            Default: 8 MiB
+
+        submit_workers: int
+            Number of batch_run submissions in flight at once.
+            Default: 2
+
+        whitelist_workers: int
+            Number of whitelist requests in flight at once, in
+            delete_from_whitelist and update_whitelist.
+            Default: 8
+
+        endpoint_cache_ttl: float
+            Seconds during which get_endpoint_status, get_endpoint_metadata and
+            get_endpoints answer from a local cache.  Older answers are still
+            returned, up to endpoint_cache_max_stale, while a background thread
+            refreshes them.  None disables the cache.
+            Default: None
+
+        endpoint_cache_max_stale: float
+            Seconds after which a cached endpoint answer is no longer served
+            and the call waits for the service.
+            Default: 60
+
+        instrument: bool
+            Record latency histograms, byte counts and error counts for every
+            web service call, and timings of (de)serialization, in
+            ``self.metrics``.  Export them with ``self.metrics.to_prometheus()``
+            or ``self.metrics.to_json()``.
+            Default: False
+
+        compression: str
+            Compress serialized task arguments of at least
+            compression_threshold characters with "zlib", "zstd" or "lz4"
+            (the latter two need the zstandard or lz4 package).  The endpoint
+            workers must be able to read compressed payloads.  Compressed
+            results are recognized and decompressed whatever this setting.
+            None disables compression.
+            Default: None
+
+        compression_threshold: int
+            Serialized size, in characters, from which arguments are compressed.
+            Default: 64 KiB
+
+        compression_level: int
+            Level passed to the compression codec.  None for its default.
+            Default: None
+
+        numpy_buffers: bool
+            Serialize task arguments holding NumPy arrays with pickle protocol 5
+            out-of-band buffers, which avoids copying the array contents, and
+            read results serialized that way.  Arrays in results are then
+            read-only views on the received data.  The endpoint workers must be
+            able to read such payloads.
+            Default: False
+
+        arg_store: str
+            Directory of a content-addressed store for large task arguments.
+            Each argument serializing to at least arg_store_threshold
+            characters is written there once, and tasks carry a small
+            reference to it instead, which the worker resolves (and caches)
+            when it deserializes the task.  The directory must be visible to
+            the endpoint workers under the same path, e.g. on a shared
+            filesystem.  None disables the store.
+            Default: None
+
+        arg_store_threshold: int
+            Serialized size, in characters, from which an argument is stored.
+            Default: 64 KiB
+
+        version_check_ttl: float
+            Seconds during which the service's version requirements, once
+            fetched, are reused from <funcx_home>/version_check.json instead of
+            being requested again by version_check.  None always asks the
+            service.
+            Default: 3600
+
+        token_refresh: bool
+            Renew the access token on a background thread before it expires,
+            so that no call waits on a renewal.  The thread is shared by all
+            clients of the process using the same token storage, and new
+            tokens are handed to all of them.  Needs a LoginManager backed by
+            token storage (the default).
+            Default: False
+
+        token_refresh_lead_time: float
+            Seconds before expiry at which the access token is renewed.
+            Default: 300
+
+        rate_limit: float | RateLimiter
+            Maximum rate, in requests per second, of the submission and status
+            requests (submit, get_task, get_batch_status, get_taskgroup_tasks).
+            Callers over the rate wait for their turn.  The rate is lowered
+            when the service throttles requests (429 or 503) and recovers
+            gradually afterwards.  Pass a RateLimiter to share one budget
+            between several clients.  None for no limit.
+            Default: None
+
+        rate_limit_burst: float
+            Number of requests that can be sent at once after a quiet period.
+            None for one second's worth of requests.
+            Default: None
+
         Keyword arguments are the same as for BaseClient.
 
         """
@@ -148,8 +451,51 @@ class Client:
         if funcx_service_address is None:
             funcx_service_address = get_web_service_url(environment)
 
-        self._task_status_table: t.Dict[str, t.Dict] = {}
+        self._task_status_table = TaskStatusCache(
+            max_entries=task_cache_size,
+            max_result_bytes=task_cache_bytes,
+            ttl=task_cache_ttl,
+        )
+        self.batch_status_page_size = batch_status_page_size
+        self.batch_status_workers = batch_status_workers
+        # created on first use, shared by every status poll of the client
+        self._batch_status_executor: ThreadPoolExecutor | None = None
+        self._batch_status_executor_lock = threading.Lock()
+        self.batch_status_page_latencies: t.List[float] = []
+        self.submit_chunk_size = submit_chunk_size
+        self.submit_chunk_bytes = submit_chunk_bytes
+        self.submit_workers = submit_workers
+        self.whitelist_workers = whitelist_workers
+        if deserialize_pool not in ("process", "thread"):
+            raise ValueError(f"Unknown deserialize_pool: {deserialize_pool!r}")
+        self.deserialize_workers = deserialize_workers
+        self.deserialize_pool = deserialize_pool
+        self.deserialize_threshold = deserialize_threshold
+        self._deserialize_executor: Executor | None = None
+        # guards writing deserialized results into shared status blocks
+        self._result_lock = threading.Lock()
+        self._closed = False
+        self._close_hook: t.Callable[[], None] | None = None
         self.funcx_home = os.path.expanduser(funcx_home)
+        self.version_check_ttl = version_check_ttl
+        self.result_store: ResultStore | None = None
+        if result_store:
+            if result_store is True:
+                result_store = os.path.join(self.funcx_home, "results.db")
+            self.result_store = ResultStore(
+                os.path.expanduser(result_store), max_bytes=result_store_bytes
+            )
+        self._endpoint_cache: StaleWhileRevalidateCache | None = None
+        if endpoint_cache_ttl is not None:
+            self._endpoint_cache = StaleWhileRevalidateCache(
+                ttl=endpoint_cache_ttl, max_stale=endpoint_cache_max_stale
+            )
+        self.environment = environment
+        self.function_cache: FunctionRegistrationCache | None = None
+        if function_cache:
+            self.function_cache = FunctionRegistrationCache(
+                os.path.join(self.funcx_home, "functions.db"), ttl=function_cache_ttl
+            )
         self.session_task_group_id = (
             task_group_id and str(task_group_id) or str(uuid.uuid4())
         )
@@ -170,6 +516,13 @@ class Client:
                 )
                 warnings.warn(msg)
 
+        self.metrics: ClientMetrics | None = ClientMetrics() if instrument else None
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit, burst=rate_limit_burst)
+        self.rate_limiter: RateLimiter | None = rate_limit
+
+        # closed by close() only if created here
+        self._owns_login_manager = login_manager is None
         # if a login manager was passed, no login flow is triggered
         if login_manager is not None:
             self.login_manager: LoginManagerProtocol = login_manager
@@ -179,10 +532,40 @@ class Client:
             self.login_manager = LoginManager(environment=environment)
             self.login_manager.ensure_logged_in()
 
+        self._token_refresher: TokenRefresher | None = None
+        if token_refresh:
+            storage = getattr(self.login_manager, "_token_storage", None)
+            if storage is None:
+                logger.warning("token_refresh needs a LoginManager with token storage")
+            else:
+                self._token_refresher = get_token_refresher(
+                    storage, lead_time=token_refresh_lead_time
+                )
+
         self.web_client = self.login_manager.get_web_client(
             base_url=funcx_service_address
         )
         self.fx_serializer = ComputeSerializer()
+        if numpy_buffers:
+            self.fx_serializer = ArrayBufferSerializer(self.fx_serializer)
+        if compression is not None:
+            self.fx_serializer = CompressingSerializer(
+                self.fx_serializer,
+                algorithm=compression,
+                threshold=compression_threshold,
+                level=compression_level,
+            )
+        self._arg_dedup: DedupSerializer | None = None
+        if arg_store is not None:
+            self.fx_serializer = self._arg_dedup = DedupSerializer(
+                self.fx_serializer,
+                DirectoryArgStore(arg_store),
+                threshold=arg_store_threshold,
+            )
+        if self.metrics is not None:
+            self.fx_serializer = InstrumentedSerializer(
+                self.fx_serializer, self.metrics
+            )
 
         self.funcx_service_address = funcx_service_address
 
@@ -192,6 +575,14 @@ class Client:
         self.results_ws_uri = None
         self.asynchronous = asynchronous or False
         if asynchronous:
+            # imported here, so that clients that never go asynchronous are
+            # spared the import of asyncio and the websocket machinery
+            import asyncio
+
+            from globus_compute_sdk.sdk.asynchronous.ws_polling_task import (
+                WebSocketPollingTask,
+            )
+
             self.loop = loop if loop else asyncio.get_event_loop()
 
             if results_ws_uri is None:
@@ -218,12 +609,98 @@ class Client:
         else:
             self.loop = None
 
+        self._submitter: CoalescingSubmitter | None = None
+        if coalesce_run:
+            if self.asynchronous:
+                raise ValueError("coalesce_run cannot be used with asynchronous")
+            self._submitter = CoalescingSubmitter(
+                self,
+                max_batch_size=coalesce_max_batch,
+                max_delay=coalesce_max_delay,
+            )
+            # don't lose buffered submissions at interpreter exit
+            self._register_close_at_exit()
+
+        # started by the first Future handed out
+        self.future_poll_interval = future_poll_interval
+        self.future_max_poll_interval = future_max_poll_interval
+        self._result_poller: ResultPoller | None = None
+        self._result_poller_lock = threading.Lock()
+
+    def _register_close_at_exit(self) -> None:
+        if self._close_hook is None:
+            self._close_hook = functools.partial(_close_at_exit, weakref.ref(self))
+            atexit.register(self._close_hook)
+
+    def close(self) -> None:
+        """Stop the client's background threads and release its resources
+
+        run() calls buffered by coalesce_run are submitted first.  Futures
+        still waiting on results are cancelled.  The worker pools, the endpoint
+        cache refresh threads and the result store are shut down, as is the
+        token storage of a LoginManager the client created itself.  The client
+        must not be used afterwards.  Called at interpreter exit for clients
+        that started background threads.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._close_hook is not None:
+            atexit.unregister(self._close_hook)
+            self._close_hook = None
+
+        if self._submitter is not None:
+            self._submitter.close()
+        with self._result_poller_lock:
+            poller = self._result_poller
+        if poller is not None:
+            poller.close()
+        if self._deserialize_executor is not None:
+            self._deserialize_executor.shutdown(wait=False, cancel_futures=True)
+        with self._batch_status_executor_lock:
+            executor, self._batch_status_executor = self._batch_status_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self._endpoint_cache is not None:
+            self._endpoint_cache.close()
+        if self.result_store is not None:
+            self.result_store.close()
+        if self._owns_login_manager:
+            storage = getattr(self.login_manager, "_token_storage", None)
+            if storage is not None and hasattr(storage, "close"):
+                storage.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def web_client(self):
+        return self._web_client
+
+    @web_client.setter
+    def web_client(self, web_client):
+        # a setter, so that clients rebuilt after a new login are measured,
+        # paced and kept refreshed too
+        if self._token_refresher is not None:
+            self._token_refresher.register(
+                getattr(web_client, "authorizer", None), ComputeScopes.resource_server
+            )
+        if self.metrics is not None:
+            web_client = InstrumentedWebClient(web_client, self.metrics)
+        if self.rate_limiter is not None:
+            # outermost, so that time spent waiting is not measured as latency
+            web_client = RateLimitedWebClient(web_client, self.rate_limiter)
+        self._web_client = web_client
+
     def version_check(self, endpoint_version: str | None = None) -> None:
         """Check this client version meets the service's minimum supported version.
 
         Raises a VersionMismatch error on failure.
         """
-        data = self.web_client.get_version()
+        data = self._get_version_requirements()
 
         min_ep_version = data["min_ep_version"]
         min_sdk_version = data["min_sdk_version"]
@@ -234,6 +711,48 @@ class Client:
                 endpoint_version, min_ep_version, package_name="globus-compute-endpoint"
             )
 
+    def _get_version_requirements(self) -> t.Dict[str, str]:
+        """Return the service's minimum versions, from the disk cache if fresh"""
+        ttl = self.version_check_ttl
+        cache_path = os.path.join(self.funcx_home, "version_check.json")
+        cache: t.Dict[str, t.Any] = {}
+        if ttl is not None:
+            try:
+                with open(cache_path) as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            entry = cache.get(self.funcx_service_address)
+            if (
+                entry
+                and entry.get("sdk_version") == __version__
+                and 0 <= time.time() - entry.get("checked_at", 0) < ttl
+            ):
+                return entry["requirements"]
+
+        data = self.web_client.get_version()
+        requirements = {
+            "min_ep_version": data["min_ep_version"],
+            "min_sdk_version": data["min_sdk_version"],
+        }
+        if ttl is not None:
+            cache[self.funcx_service_address] = {
+                "sdk_version": __version__,
+                "checked_at": time.time(),
+                "requirements": requirements,
+            }
+            try:
+                os.makedirs(self.funcx_home, exist_ok=True)
+                # write and rename, so that concurrent clients never read a
+                # partial file
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.debug(f"Unable to cache the version check: {e}")
+        return requirements
+
     def logout(self):
         """Remove credentials from your local system"""
         self.login_manager.logout()
@@ -243,6 +762,10 @@ class Client:
         Parses the return message from the service and updates the
         internal _task_status_table
 
+        Results are stored serialized, under RESULT_PAYLOAD_KEY, and only
+        deserialized when first accessed (see _deserialize_result).  Pending
+        statuses are returned but not kept in the table.
+
         Parameters
         ----------
 
@@ -259,26 +782,136 @@ class Client:
         r_status = r_dict.get("status", "unknown").lower()
         pending = r_status not in ("success", "failed")
         status = {"pending": pending, "status": r_status}
+        result_size = 0
 
         if not pending:
             if "result" not in r_dict and "exception" not in r_dict:
                 raise ValueError("non-pending result is missing result data")
             completion_t = r_dict["completion_t"]
             if "result" in r_dict:
-                try:
-                    r_obj = self.fx_serializer.deserialize(r_dict["result"])
-                except Exception:
-                    raise SerializationError("Result Object Deserialization")
-                else:
-                    status.update({"result": r_obj, "completion_t": completion_t})
+                status.update(
+                    {RESULT_PAYLOAD_KEY: r_dict["result"], "completion_t": completion_t}
+                )
+                result_size = len(r_dict["result"])
             elif "exception" in r_dict:
                 raise TaskExecutionFailed(r_dict["exception"], completion_t)
             else:
                 raise NotImplementedError("unreachable")
 
-        self._task_status_table[task_id] = status
+        self._task_status_table.set(task_id, status, size=result_size)
+        if self.result_store is not None and RESULT_PAYLOAD_KEY in status:
+            self.result_store.put(
+                task_id, r_status, completion_t, status[RESULT_PAYLOAD_KEY]
+            )
+        return status
+
+    def _lookup_completed(self, task_id_list: t.List[str]) -> t.Dict[str, t.Dict]:
+        """Return the status blocks of the tasks known locally to be complete
+
+        The in-memory task table is consulted first, then the on-disk result
+        store; results found on disk are loaded back into the task table.
+        """
+        found = {}
+        missing = []
+        for task_id in task_id_list:
+            task = self._task_status_table.get(task_id, {})
+            if task.get("pending", True) is False:
+                found[task_id] = task
+            else:
+                missing.append(task_id)
+
+        if missing and self.result_store is not None:
+            stored = self.result_store.get_many(missing)
+            for task_id, (r_status, completion_t, payload) in stored.items():
+                status = {
+                    "pending": False,
+                    "status": r_status,
+                    RESULT_PAYLOAD_KEY: payload,
+                    "completion_t": completion_t,
+                }
+                self._task_status_table.set(task_id, status, size=len(payload))
+                found[task_id] = status
+        return found
+
+    def _store_result(self, status: t.Dict, result: t.Any) -> None:
+        # status blocks are shared with other threads (e.g. the ResultPoller):
+        # "result" is set before the payload is dropped, so that a reader never
+        # finds neither, and only the first of concurrent writers wins
+        with self._result_lock:
+            if "result" not in status:
+                status["result"] = result
+                status.pop(RESULT_PAYLOAD_KEY, None)
+
+    def _deserialize_result(self, status: t.Dict) -> t.Dict:
+        """Deserialize the stored result payload of a status block, in place"""
+        if "result" in status:
+            return status
+        payload = status.get(RESULT_PAYLOAD_KEY)
+        if payload is None:
+            return status
+        try:
+            result = self.fx_serializer.deserialize(decompress_payload(payload))
+        except Exception:
+            raise SerializationError("Result Object Deserialization")
+        self._store_result(status, result)
         return status
 
+    def _should_offload(self, status: t.Dict) -> bool:
+        return (
+            self.deserialize_workers > 0
+            and "result" not in status
+            and len(status.get(RESULT_PAYLOAD_KEY, "")) >= self.deserialize_threshold
+        )
+
+    def _deserialize_in_pool(self, offloaded: t.List[t.Tuple[str, t.Dict]]):
+        """Deserialize the given status blocks' results on the worker pool
+
+        Results are written back into each status block in order.  Returns the
+        ids of the tasks whose result failed to deserialize.
+        """
+        if self._deserialize_executor is None:
+            if self.deserialize_pool == "process":
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._deserialize_executor = ProcessPoolExecutor(
+                    max_workers=self.deserialize_workers
+                )
+            else:
+                self._deserialize_executor = ThreadPoolExecutor(
+                    max_workers=self.deserialize_workers
+                )
+
+        futures: t.List[Future | None] = []
+        for _, status in offloaded:
+            payload = status.get(RESULT_PAYLOAD_KEY)
+            # None if another thread has deserialized it meanwhile
+            futures.append(
+                None
+                if payload is None
+                else self._deserialize_executor.submit(_deserialize_payload, payload)
+            )
+        failed = []
+        for (task_id, status), future in zip(offloaded, futures):
+            if future is None:
+                continue
+            try:
+                result = future.result()
+            except Exception:
+                logger.exception(f"Failure while deserializing result of {task_id}")
+                failed.append(task_id)
+            else:
+                self._store_result(status, result)
+        return failed
+
+    @staticmethod
+    def _status_only(status: t.Dict) -> t.Dict:
+        dropped = ("result", RESULT_PAYLOAD_KEY)
+        return {k: v for k, v in status.items() if k not in dropped}
+
+    def get_task_cache_stats(self) -> t.Dict[str, int]:
+        """Return hit/miss/eviction counters and occupancy of the task table"""
+        return self._task_status_table.stats()
+
     @requires_login
     def get_task(self, task_id):
         """Get a Globus Compute task.
@@ -293,14 +926,14 @@ class Client:
         dict
             Task block containing "status" key.
         """
-        task = self._task_status_table.get(task_id, {})
-        if task.get("pending", True) is False:
-            return task
+        task = self._lookup_completed([task_id]).get(task_id)
+        if task is not None:
+            return self._deserialize_result(task)
 
         r = self.web_client.get_task(task_id)
         logger.debug(f"Response string : {r}")
         rets = self._update_task_table(r.text, task_id)
-        return rets
+        return self._deserialize_result(rets)
 
     @requires_login
     def get_result(self, task_id):
@@ -330,45 +963,328 @@ class Client:
                 task["exception"].reraise()
 
     @requires_login
-    def get_batch_result(self, task_id_list):
-        """Request status for a batch of task_ids"""
+    def get_batch_result(self, task_id_list, status_only: bool = False):
+        """Request status for a batch of task_ids
+
+        Parameters
+        ----------
+        task_id_list : list of str
+            UUIDs of the tasks
+        status_only : bool
+            If True, results are not deserialized and the returned status blocks
+            omit the "result" key; fetch results later with get_result.
+            Default: False
+
+        Returns
+        -------
+        dict
+            Task blocks keyed by task id, for the tasks the service reported on
+        """
         assert isinstance(
             task_id_list, list
         ), "get_batch_result expects a list of task ids"
 
+        # snapshot completed tasks up front; later table updates may evict them
+        cached = self._lookup_completed(task_id_list)
         pending_task_ids = [
-            task_id
-            for task_id in task_id_list
-            if self._task_status_table.get(task_id, {}).get("pending", True) is True
+            task_id for task_id in task_id_list if task_id not in cached
         ]
 
         results = {}
+        status_data: t.Dict[str, t.Any] = {}
 
         if pending_task_ids:
-            r = self.web_client.get_batch_status(pending_task_ids)
-            logger.debug(f"Response string : {r}")
-
-        pending_task_ids = set(pending_task_ids)
+            status_data = self._get_batch_status(pending_task_ids)
 
+        missing = 0
+        offloaded: t.List[t.Tuple[str, t.Dict]] = []
         for task_id in task_id_list:
-            if task_id in pending_task_ids:
-                try:
-                    data = r["results"][task_id]
-                    rets = self._update_task_table(data, task_id)
-                    results[task_id] = rets
-                except KeyError:
-                    logger.debug("Task {} info was not available in the batch status")
-                except Exception:
-                    logger.exception(
-                        "Failure while unpacking results fom get_batch_result"
-                    )
-            else:
-                results[task_id] = self._task_status_table[task_id]
+            status = cached.get(task_id)
+            data = None if status is not None else status_data.get(task_id)
+            if status is None and data is None:
+                missing += 1
+                continue
+            try:
+                if status is None:
+                    status = self._update_task_table(data, task_id)
+                if status_only:
+                    results[task_id] = self._status_only(status)
+                elif self._should_offload(status):
+                    # keep the slot so results stay in task_id_list order
+                    results[task_id] = status
+                    offloaded.append((task_id, status))
+                else:
+                    results[task_id] = self._deserialize_result(status)
+            except Exception:
+                logger.exception("Failure while unpacking results fom get_batch_result")
+
+        if offloaded:
+            for task_id in self._deserialize_in_pool(offloaded):
+                del results[task_id]
+
+        if missing:
+            logger.debug(f"{missing} task(s) info was not available in batch status")
 
         return results
 
     @requires_login
-    def run(self, *args, endpoint_id=None, function_id=None, **kwargs) -> str:
+    def _get_task_group_task_ids(self, task_group_id: str) -> t.List[str]:
+        r = self.web_client.get_taskgroup_tasks(task_group_id)
+        logger.debug(f"Task group {task_group_id} holds {len(r['tasks'])} tasks")
+        return [task["id"] for task in r["tasks"]]
+
+    def iter_task_group_results(
+        self,
+        task_group_id: str | None = None,
+        status_only: bool = True,
+        sweep_size: int = 10000,
+    ) -> t.Iterator[t.Tuple[str, t.Dict]]:
+        """Yield the status of every task of a task group, one sweep at a time
+
+        The ids of the group's tasks are fetched from the service, then their
+        status is requested with get_batch_result, ``sweep_size`` tasks at a
+        time.  Completed tasks are recorded in the task table, and in the
+        result store if there is one, so a later sweep, or get_result, only
+        goes to the service for the tasks that were still pending.  Only one
+        sweep's worth of status blocks is held at once.
+
+        Parameters
+        ----------
+        task_group_id : str
+            UUID of the task group. Default: session_task_group_id
+        status_only : bool
+            If True, results are not deserialized; see get_batch_result.
+            Default: True
+        sweep_size : int
+            Number of tasks whose status is requested per get_batch_result call.
+            Default: 10000
+
+        Yields
+        ------
+        (task_id, status) : tuple
+            Task blocks as returned by get_batch_result; tasks that failed are
+            left out, as there
+        """
+        if task_group_id is None:
+            task_group_id = self.session_task_group_id
+        task_ids = self._get_task_group_task_ids(task_group_id)
+
+        for i in range(0, len(task_ids), sweep_size):
+            sweep = task_ids[i : i + sweep_size]
+            yield from self.get_batch_result(sweep, status_only=status_only).items()
+
+    def _get_batch_status_executor(self) -> ThreadPoolExecutor:
+        with self._batch_status_executor_lock:
+            if self._batch_status_executor is None:
+                self._batch_status_executor = ThreadPoolExecutor(
+                    max_workers=self.batch_status_workers,
+                    thread_name_prefix="batch-status",
+                )
+            return self._batch_status_executor
+
+    def _get_batch_status_page(
+        self, task_id_list: t.List[str]
+    ) -> t.Tuple[t.Dict[str, t.Any], float]:
+        start = time.monotonic()
+        r = self.web_client.get_batch_status(task_id_list)
+        logger.debug(f"Response string : {r}")
+        return r["results"], time.monotonic() - start
+
+    @requires_login
+    def _get_batch_status(self, task_id_list: t.List[str]) -> t.Dict[str, t.Any]:
+        """Fetch the raw status blocks for a list of task ids, keyed by task id
+
+        An expired login is handled here, on the calling thread, rather than on
+        each page's thread; see _request_batch_status.
+        """
+        return self._request_batch_status(task_id_list)
+
+    def _request_batch_status(self, task_id_list: t.List[str]) -> t.Dict[str, t.Any]:
+        """Fetch the raw status blocks for a list of task ids, without logging in
+
+        Lists longer than ``batch_status_page_size`` are split into pages which
+        are requested concurrently on at most ``batch_status_workers`` threads,
+        from a pool kept for the client's lifetime.  The latency of each page
+        is recorded in ``batch_status_page_latencies``.
+        Background threads (e.g. the ResultPoller) call this directly: an
+        AuthAPIError is raised to them rather than starting a login flow.
+        """
+        page_size = self.batch_status_page_size or len(task_id_list) or 1
+        pages = [
+            task_id_list[i : i + page_size]
+            for i in range(0, len(task_id_list), page_size)
+        ]
+
+        if len(pages) <= 1 or self.batch_status_workers <= 1:
+            page_results = [self._get_batch_status_page(page) for page in pages]
+        else:
+            pool = self._get_batch_status_executor()
+            page_results = list(pool.map(self._get_batch_status_page, pages))
+
+        results: t.Dict[str, t.Any] = {}
+        latencies = []
+        for page, (page_data, elapsed) in zip(pages, page_results):
+            results.update(page_data)
+            latencies.append(elapsed)
+            logger.debug(f"Batch status page of {len(page)} tasks took {elapsed:.3f}s")
+        self.batch_status_page_latencies = latencies
+        return results
+
+    def iter_results(
+        self,
+        task_ids: t.Iterable[str],
+        poll_interval: float = 0.1,
+        max_poll_interval: float = 10.0,
+        timeout: float | None = None,
+    ) -> t.Iterator[t.Tuple[str, t.Any]]:
+        """Yield results of the given tasks as they complete
+
+        Only the task ids that are still pending are sent to the service on each
+        poll.  Polls are spaced by a PollScheduler: the delay drops to its floor
+        whenever a poll reports completed tasks and backs off exponentially, with
+        jitter, whenever it reports none.  The floor and ceiling adapt to the gap
+        between observed task completion times.
+
+        Parameters
+        ----------
+        task_ids : iterable of str
+            UUIDs of the tasks to wait on
+        poll_interval : float
+            Minimum delay between polls, in seconds. Default: 0.1
+        max_poll_interval : float
+            Maximum delay between polls, in seconds. Default: 10.0
+        timeout : float
+            Seconds to wait before giving up. Default: None (wait forever)
+
+        Yields
+        ------
+        (task_id, result_or_exception) : tuple
+            The result object of a successful task, or the exception raised while
+            unpacking a failed one (typically TaskExecutionFailed)
+
+        Raises
+        ------
+        TimeoutError
+            If tasks are still pending after ``timeout`` seconds
+        """
+        scheduler = PollScheduler(
+            min_interval=poll_interval,
+            max_interval=max_poll_interval,
+            deadline=None if timeout is None else time.monotonic() + timeout,
+        )
+        for task_id, status in self._iter_completed(task_ids, scheduler):
+            if isinstance(status, Exception):
+                yield task_id, status
+                continue
+            try:
+                yield task_id, self._deserialize_result(status)["result"]
+            except Exception as e:
+                yield task_id, e
+
+    def _iter_completed(
+        self, task_ids: t.Iterable[str], scheduler: PollScheduler
+    ) -> t.Iterator[t.Tuple[str, t.Any]]:
+        """Yield (task_id, status_block_or_exception) as tasks complete
+
+        Status blocks are yielded as stored in the task table, i.e. with the
+        result still serialized.
+        """
+        # dict as an ordered set: O(1) removal, preserves submission order
+        pending = dict.fromkeys(task_ids)
+        total = len(pending)
+
+        for task_id, task in self._lookup_completed(list(pending)).items():
+            del pending[task_id]
+            yield task_id, task
+
+        while pending:
+            # unpack the whole poll before yielding so the task table is up to
+            # date even if the caller stops consuming early
+            finished: t.List[t.Tuple[str, t.Any]] = []
+            for task_id, data in self._get_batch_status(list(pending)).items():
+                if task_id not in pending:
+                    continue
+                try:
+                    status = self._update_task_table(data, task_id)
+                except Exception as e:
+                    del pending[task_id]
+                    scheduler.observe(getattr(e, "completion_t", None))
+                    finished.append((task_id, e))
+                    continue
+                if status["pending"] is False:
+                    del pending[task_id]
+                    scheduler.observe(status.get("completion_t"))
+                    finished.append((task_id, status))
+
+            yield from finished
+
+            if not pending:
+                break
+            if scheduler.expired():
+                raise TimeoutError(f"{len(pending)} (of {total}) tasks unfinished")
+            time.sleep(scheduler.next_delay(progress=bool(finished)))
+
+    def wait(
+        self,
+        task_ids: t.Iterable[str],
+        timeout: float | None = None,
+        return_when: str = ALL_COMPLETED,
+        poll_interval: float = 0.1,
+        max_poll_interval: float = 30.0,
+    ) -> DoneAndNotDoneTasks:
+        """Wait for tasks to complete, in the manner of concurrent.futures.wait
+
+        Parameters
+        ----------
+        task_ids : iterable of str
+            UUIDs of the tasks to wait on
+        timeout : float
+            Maximum number of seconds to wait. Default: None (no limit)
+        return_when : str
+            FIRST_COMPLETED, FIRST_EXCEPTION or ALL_COMPLETED (from
+            concurrent.futures). Default: ALL_COMPLETED
+        poll_interval : float
+            Minimum delay between polls, in seconds. Default: 0.1
+        max_poll_interval : float
+            Maximum delay between polls, in seconds. Default: 30.0
+
+        Returns
+        -------
+        DoneAndNotDoneTasks
+            Named 2-tuple of sets, ``done`` and ``not_done`` task ids.  Results
+            of done tasks are available through get_result.
+        """
+        if return_when not in (FIRST_COMPLETED, FIRST_EXCEPTION, ALL_COMPLETED):
+            raise ValueError(f"Invalid return condition: {return_when!r}")
+
+        task_ids = set(task_ids)
+        done: t.Set[str] = set()
+        scheduler = PollScheduler(
+            min_interval=poll_interval,
+            max_interval=max_poll_interval,
+            deadline=None if timeout is None else time.monotonic() + timeout,
+        )
+        # results are left serialized until the caller asks for them
+        results = self._iter_completed(task_ids, scheduler)
+        try:
+            for task_id, status in results:
+                done.add(task_id)
+                if return_when == FIRST_COMPLETED:
+                    break
+                if return_when == FIRST_EXCEPTION and isinstance(status, Exception):
+                    break
+        except TimeoutError:
+            pass
+        finally:
+            results.close()
+
+        # the last poll may have completed more tasks than were consumed
+        done.update(self._lookup_completed(list(task_ids - done)))
+
+        return DoneAndNotDoneTasks(done, task_ids - done)
+
+    @requires_login
+    def run(self, *args, endpoint_id=None, function_id=None, **kwargs) -> str | Future:
         """Initiate an invocation
 
         Parameters
@@ -390,16 +1306,173 @@ class Client:
         Globus Compute Task: asyncio.Task
         A future that will eventually resolve into the function's result if
         asynchronous is True
+
+        concurrent.futures.Future
+        A future that resolves into the task's UUID string once its batch has
+        been submitted, if the client was created with coalesce_run=True
         """
         assert endpoint_id is not None, "endpoint_id key-word argument must be set"
         assert function_id is not None, "function_id key-word argument must be set"
 
+        if self._submitter is not None:
+            return self._submitter.submit(function_id, endpoint_id, args, kwargs)
+
         batch = self.create_batch(create_websocket_queue=self.asynchronous)
         batch.add(function_id, endpoint_id, args, kwargs)
         r = self.batch_run(batch)
 
         return r[0]
 
+    def flush_submissions(self) -> None:
+        """Submit any run() calls buffered by coalesce_run, and wait for them"""
+        if self._submitter is not None:
+            self._submitter.flush()
+
+    def _get_result_poller(self) -> ResultPoller:
+        if self.asynchronous:
+            raise ValueError("Futures of task results cannot be used with asynchronous")
+        with self._result_poller_lock:
+            if self._result_poller is None:
+                self._result_poller = ResultPoller(
+                    self,
+                    min_interval=self.future_poll_interval,
+                    max_interval=self.future_max_poll_interval,
+                )
+                self._register_close_at_exit()
+            return self._result_poller
+
+    def _track_submission(self, poller: ResultPoller, submission: Future) -> Future:
+        # chain a Future of a task id (from coalesce_run) to one of its result
+        future: Future = Future()
+
+        def submitted(f: Future) -> None:
+            if f.cancelled():
+                future.cancel()
+            elif f.exception() is not None:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(f.exception())
+            else:
+                try:
+                    poller.track(f.result(), future)
+                except RuntimeError as e:
+                    # the client was closed meanwhile
+                    if future.set_running_or_notify_cancel():
+                        future.set_exception(e)
+
+        submission.add_done_callback(submitted)
+        return future
+
+    def submit_future(
+        self, *args, endpoint_id=None, function_id=None, **kwargs
+    ) -> Future:
+        """Initiate an invocation, returning a Future of its result
+
+        The Futures returned by submit_future, batch_run_futures and get_futures
+        are all resolved by one background thread, which polls every task
+        still awaited in the same batch status requests.  Waiting on many
+        Futures thus costs no more requests than waiting on one.
+
+        Parameters
+        ----------
+        *args : Any
+            Args as specified by the function signature
+        endpoint_id : uuid str
+            Endpoint UUID string. Required
+        function_id : uuid str
+            Function UUID string. Required
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the function's result, or raises the task's exception
+            (typically TaskExecutionFailed).  The task UUID is available as
+            its ``task_id`` attribute once the task has been submitted.
+        """
+        assert endpoint_id is not None, "endpoint_id key-word argument must be set"
+        assert function_id is not None, "function_id key-word argument must be set"
+
+        poller = self._get_result_poller()
+        if self._submitter is not None:
+            submission = self._submitter.submit(function_id, endpoint_id, args, kwargs)
+            return self._track_submission(poller, submission)
+
+        batch = self.create_batch()
+        batch.add(function_id, endpoint_id, args, kwargs)
+        return poller.track(self.batch_run(batch)[0])
+
+    def batch_run_futures(self, batch) -> t.List[Future]:
+        """Submit a batch like batch_run, returning Futures of the task results
+
+        Parameters
+        ----------
+        batch : Batch
+            The batch to submit
+
+        Returns
+        -------
+        list of concurrent.futures.Future
+            One Future per task, in the order the tasks were added; see
+            submit_future.  If some chunks of the batch could not be
+            submitted, the Futures of their tasks raise the submission error.
+        """
+        poller = self._get_result_poller()
+        try:
+            task_ids = self.batch_run(batch)
+        except TaskExecutionFailed as e:
+            partial = getattr(e, "task_uuids", None)
+            if not partial:
+                raise
+            futures = []
+            for task_id in partial:
+                if task_id is None:
+                    future: Future = Future()
+                    future.set_exception(e)
+                    futures.append(future)
+                else:
+                    futures.append(poller.track(task_id))
+            return futures
+        return [poller.track(task_id) for task_id in task_ids]
+
+    def get_futures(self, task_ids: t.Iterable[str]) -> t.List[Future]:
+        """Return Futures of the results of already submitted tasks
+
+        Parameters
+        ----------
+        task_ids : iterable of str
+            UUIDs of the tasks
+
+        Returns
+        -------
+        list of concurrent.futures.Future
+            One Future per task id; see submit_future
+        """
+        poller = self._get_result_poller()
+        return [poller.track(task_id) for task_id in task_ids]
+
+    def get_result_poller_stats(self) -> t.Dict[str, int]:
+        """Return poll and resolution counters of the Future poller, if started"""
+        if self._result_poller is None:
+            return {}
+        return self._result_poller.stats()
+
+    def create_router(self, endpoint_ids: t.Sequence[str], **kwargs) -> EndpointRouter:
+        """
+        Create an EndpointRouter that spreads batches across several endpoints,
+        weighted by their free workers and observed turnaround times
+
+        Parameters
+        ----------
+        endpoint_ids : list of str
+            UUIDs of the endpoints to route to
+
+        Keyword arguments are passed to EndpointRouter.
+
+        Returns
+        -------
+        EndpointRouter instance
+        """
+        return EndpointRouter(self, endpoint_ids, **kwargs)
+
     def create_batch(self, task_group_id=None, create_websocket_queue=False) -> Batch:
         """
         Create a Batch instance to handle batch submission in Globus Compute
@@ -425,50 +1498,71 @@ class Client:
         if not task_group_id:
             task_group_id = self.session_task_group_id
 
-        return Batch(
+        batch = Batch(
             task_group_id=task_group_id, create_websocket_queue=create_websocket_queue
         )
+        if not isinstance(self.fx_serializer, ComputeSerializer):
+            # compress and time argument serialization too
+            batch.fx_serializer = self.fx_serializer
+        return batch
 
     @requires_login
     def batch_run(self, batch) -> t.List[str]:
         """Initiate a batch of tasks to Globus Compute
 
+        Batches larger than ``submit_chunk_size`` tasks or ``submit_chunk_bytes``
+        bytes of serialized arguments are sent as several submissions, up to
+        ``submit_workers`` of them in flight at once.  A failing chunk or task
+        does not prevent the others from being submitted.
+
         Parameters
         ----------
         batch: a Batch object
 
         Returns
         -------
-        task_ids : a list of UUID strings that identify the tasks
+        task_ids : a list of UUID strings that identify the tasks, in the order
+            they were added to the batch
+
+        Raises
+        ------
+        Exception
+            The error raised by the submission, e.g. a GlobusAPIError, if every
+            chunk failed to be sent
+        TaskExecutionFailed
+            If only some tasks could not be submitted, once every chunk has
+            been sent.  The exception carries ``task_uuids`` (None for each
+            failed task) and ``failures``, a dict of failed task index to
+            reason.
         """
+        return self._batch_run(batch)
+
+    def _batch_run(self, batch) -> t.List[str]:
+        # batch_run without the login handling, for background threads (e.g.
+        # the CoalescingSubmitter), which must not start a login flow
         assert isinstance(batch, Batch), "Requires a Batch object as input"
         assert len(batch.tasks) > 0, "Requires a non-empty batch"
 
         data = batch.prepare()
+        chunks = self._chunk_tasks(data["tasks"])
 
-        # Send the data to Globus Compute
-        r = self.web_client.submit(data)
-
-        task_uuids: t.List[str] = []
-        for result in r["results"]:
-            task_id = result["task_uuid"]
-            task_uuids.append(task_id)
-            if not (200 <= result["http_status_code"] < 300):
-                # this method of handling errors for a batch response is not
-                # ideal, as it will raise any error in the multi-response,
-                # but it will do until batch_run is deprecated in favor of Executer
-                # Note that some errors may already be caught and raised
-                # by globus_compute_sdk.sdk.client.request as GlobusAPIError
-
-                # Checking for 'Failed' is how FuncxResponseError.unpack
-                # originally checked for errors.
+        if len(chunks) == 1 or self.submit_workers <= 1:
+            responses = [self._submit_chunk(data, chunk) for chunk in chunks]
+        else:
+            # while one chunk is in flight the next one is being encoded
+            workers = min(self.submit_workers, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._submit_chunk, data, chunk) for chunk in chunks
+                ]
+                responses = [f.result() for f in futures]
 
-                # All errors should have 'reason' but just in case
-                error_reason = result.get("reason", "Unknown execution failure")
-                raise TaskExecutionFailed(error_reason)
+        task_uuids = self._unpack_submit_responses(chunks, responses)
 
         if self.asynchronous:
-            task_group_id = r["task_group_id"]
+            from globus_compute_sdk.sdk.asynchronous.compute_task import ComputeTask
+
+            task_group_id = responses[0]["task_group_id"]
             asyncio_tasks = []
             for task_id in task_uuids:
                 funcx_task = ComputeTask(task_id)
@@ -481,6 +1575,77 @@ class Client:
 
         return task_uuids
 
+    @staticmethod
+    def _unpack_submit_responses(
+        chunks: t.List[t.List[t.Any]], responses: t.List[t.Any]
+    ) -> t.List[str]:
+        """Collect task UUIDs, in order, from per-chunk submit responses
+
+        ``responses`` holds, for each chunk, the service response or the
+        exception raised while submitting it.  If every chunk failed, the first
+        chunk's exception is raised as is, so that callers keep its type and
+        HTTP status.
+        """
+        if all(isinstance(r, Exception) for r in responses):
+            raise responses[0]
+
+        task_uuids: t.List[t.Any] = []
+        failures: t.Dict[int, str] = {}
+        for chunk, r in zip(chunks, responses):
+            if isinstance(r, Exception):
+                for _ in chunk:
+                    failures[len(task_uuids)] = str(r)
+                    task_uuids.append(None)
+                continue
+            for result in r["results"]:
+                task_uuids.append(result["task_uuid"])
+                if not (200 <= result["http_status_code"] < 300):
+                    # Note that some errors may already be caught and raised
+                    # by globus_compute_sdk.sdk.client.request as GlobusAPIError
+
+                    # All errors should have 'reason' but just in case
+                    error_reason = result.get("reason", "Unknown execution failure")
+                    failures[len(task_uuids) - 1] = error_reason
+                    task_uuids[-1] = None
+
+        if failures:
+            first_reason = failures[min(failures)]
+            exc = TaskExecutionFailed(
+                f"{len(failures)} of {len(task_uuids)} tasks failed to submit; "
+                f"first failure: {first_reason}"
+            )
+            exc.task_uuids = task_uuids
+            exc.failures = failures
+            raise exc
+        return task_uuids
+
+    def _chunk_tasks(self, tasks: t.List[t.Any]) -> t.List[t.List[t.Any]]:
+        """Split prepared batch tasks by count and serialized payload size"""
+        max_tasks = self.submit_chunk_size or len(tasks)
+        max_bytes = self.submit_chunk_bytes
+        chunks: t.List[t.List[t.Any]] = [[]]
+        chunk_bytes = 0
+        for task in tasks:
+            # (function_id, endpoint_id, payload)
+            task_bytes = sum(len(str(field)) for field in task)
+            if chunks[-1] and (
+                len(chunks[-1]) >= max_tasks
+                or (max_bytes and chunk_bytes + task_bytes > max_bytes)
+            ):
+                chunks.append([])
+                chunk_bytes = 0
+            chunks[-1].append(task)
+            chunk_bytes += task_bytes
+        return chunks
+
+    def _submit_chunk(self, data: t.Dict[str, t.Any], chunk: t.List[t.Any]):
+        """Submit one chunk of a batch; returns the response or the exception"""
+        try:
+            return self.web_client.submit({**data, "tasks": chunk})
+        except Exception as e:
+            logger.warning(f"Submission of {len(chunk)} tasks failed: {e}")
+            return e
+
     @requires_login
     def register_endpoint(
         self,
@@ -578,8 +1743,10 @@ class Client:
         dict
             The details of the endpoint's stats
         """
-        r = self.web_client.get_endpoint_status(endpoint_uuid)
-        return r.data
+        return self._cached_endpoint_call(
+            ("status", str(endpoint_uuid)),
+            lambda: self.web_client.get_endpoint_status(endpoint_uuid).data,
+        )
 
     @requires_login
     def get_endpoint_metadata(self, endpoint_uuid):
@@ -597,8 +1764,10 @@ class Client:
             configuration values. If there were any issues deserializing this data, may
             also include an "errors" key.
         """
-        r = self.web_client.get_endpoint_metadata(endpoint_uuid)
-        return r.data
+        return self._cached_endpoint_call(
+            ("metadata", str(endpoint_uuid)),
+            lambda: self.web_client.get_endpoint_metadata(endpoint_uuid).data,
+        )
 
     @requires_login
     def get_endpoints(self):
@@ -609,8 +1778,51 @@ class Client:
         list
             A list of dictionaries which contain endpoint info
         """
-        r = self.web_client.get_endpoints()
-        return r.data
+        return self._cached_endpoint_call(
+            ("endpoints",), lambda: self.web_client.get_endpoints().data
+        )
+
+    def _cached_endpoint_call(self, key: t.Tuple, loader: t.Callable[[], t.Any]):
+        if self._endpoint_cache is None:
+            return loader()
+        return self._endpoint_cache.get(key, loader)
+
+    def get_endpoint_cache_stats(self) -> t.Dict[str, int]:
+        """Return hit/miss counters of the endpoint cache, if enabled"""
+        if self._endpoint_cache is None:
+            return {}
+        return self._endpoint_cache.stats()
+
+    def get_rate_limiter_stats(self) -> t.Dict[str, t.Any]:
+        """Return the current rate, wait and throttling counters, if limited"""
+        if self.rate_limiter is None:
+            return {}
+        return self.rate_limiter.stats()
+
+    def get_arg_store_stats(self) -> t.Dict[str, int]:
+        """Return reference and upload counters of the argument store, if enabled"""
+        if self._arg_dedup is None:
+            return {}
+        return self._arg_dedup.stats()
+
+    def invalidate_endpoint_cache(self, endpoint_uuid: str | None = None) -> None:
+        """Drop cached endpoint status, metadata and listings
+
+        Parameters
+        ----------
+        endpoint_uuid : str
+            Only drop the entries of this endpoint (and the endpoint listing).
+            Default: None (drop everything)
+        """
+        if self._endpoint_cache is None:
+            return
+        if endpoint_uuid is None:
+            self._endpoint_cache.invalidate()
+        else:
+            uuid_str = str(endpoint_uuid)
+            self._endpoint_cache.invalidate(
+                lambda key: key == ("endpoints",) or key[-1] == uuid_str
+            )
 
     @requires_login
     def register_function(
@@ -665,9 +1877,49 @@ class Client:
             group=group,
             serializer=self.fx_serializer,
         )
+        cache_key = None
+        if self.function_cache is not None:
+            cache_key = self._function_cache_key(data.to_dict())
+            function_uuid = self.function_cache.get(cache_key)
+            if function_uuid is not None:
+                logger.debug(f"Function {data.function_name} already registered")
+                return function_uuid
+
         logger.info(f"Registering function : {data}")
         r = self.web_client.register_function(data)
-        return r.data["function_uuid"]
+        function_uuid = r.data["function_uuid"]
+        if cache_key is not None:
+            self.function_cache.put(cache_key, function_uuid)
+        return function_uuid
+
+    def _function_cache_key(self, registration: t.Dict[str, t.Any]) -> str:
+        # functions are private to the identity that registers them: key them
+        # by the namespace of the tokens this client logs in with
+        storage = getattr(self.login_manager, "_token_storage", None)
+        namespace = getattr(storage, "namespace", None)
+        if namespace is None:
+            namespace = _resolve_namespace(self.environment)
+        assert self.function_cache is not None
+        return self.function_cache.make_key(
+            registration, self.funcx_service_address, namespace
+        )
+
+    def invalidate_function_cache(self, function_id: str | None = None) -> int:
+        """Forget locally cached function registrations
+
+        Parameters
+        ----------
+        function_id : str
+            Only forget registrations of this function UUID. Default: None (all)
+
+        Returns
+        -------
+        int
+            The number of cached registrations forgotten
+        """
+        if self.function_cache is None:
+            return 0
+        return self.function_cache.invalidate(function_id)
 
     @requires_login
     def register_container(self, location, container_type, name="", description=""):
@@ -780,27 +2032,135 @@ class Client:
 
     @requires_login
     def delete_from_whitelist(self, endpoint_id, function_ids):
-        """List the endpoint's whitelist
+        """Removes functions from the endpoint's whitelist
+
+        One request is sent per function, on up to ``whitelist_workers``
+        threads.  If any request fails, the first error is raised once all of
+        them have completed; use update_whitelist to get every error.  An
+        expired login is handled once for the whole call.
 
         Parameters
         ----------
         endpoint_id : str
             The uuid of the endpoint
         function_ids : list
-            A list of function id's to be whitelisted
+            A list of function id's to be removed from the whitelist
 
         Returns
         -------
-        json
-            The response of the request
+        list of json
+            The responses of the requests, in the order of function_ids
         """
         if not isinstance(function_ids, list):
             function_ids = [function_ids]
-        res = []
-        for fid in function_ids:
-            res.append(self.web_client.whitelist_remove(endpoint_id, fid))
+        res = self._map_whitelist_requests(
+            lambda fid: self.web_client.whitelist_remove(endpoint_id, fid),
+            function_ids,
+        )
+        for r in res:
+            if isinstance(r, Exception):
+                raise r
         return res
 
+    def _map_whitelist_requests(
+        self, request: t.Callable[[t.Any], t.Any], items: t.List[t.Any]
+    ) -> t.List[t.Any]:
+        """Return request(item) for each item, or the exception it raised
+
+        Requests run on up to ``whitelist_workers`` threads; the responses are
+        in the order of items.  An AuthAPIError is not returned but raised, once
+        the requests in flight have completed, so that the caller's
+        @requires_login logs in and retries the whole call once; requests not
+        yet sent by then are skipped.
+        """
+        auth_errors: t.List[globus_sdk.AuthAPIError] = []
+
+        def call(item):
+            if auth_errors:
+                return auth_errors[0]
+            try:
+                return request(item)
+            except globus_sdk.AuthAPIError as e:
+                auth_errors.append(e)
+                return e
+            except Exception as e:
+                return e
+
+        if len(items) <= 1 or self.whitelist_workers <= 1:
+            responses = [call(item) for item in items]
+        else:
+            workers = min(self.whitelist_workers, len(items))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                responses = list(pool.map(call, items))
+        if auth_errors:
+            raise auth_errors[0]
+        return responses
+
+    @requires_login
+    def update_whitelist(
+        self,
+        endpoint_id: str,
+        add: t.Iterable[str] = (),
+        remove: t.Iterable[str] = (),
+        add_chunk_size: int = 500,
+    ) -> WhitelistUpdate:
+        """Add and remove many functions of the endpoint's whitelist
+
+        Functions are added with one request per ``add_chunk_size`` functions,
+        and removed with one request each, as the service has no bulk removal.
+        All requests run concurrently, on up to ``whitelist_workers`` threads.
+        A failed request does not stop the others: its error is reported for
+        each function it concerned.  An expired login is not reported this way
+        but handled once, by logging in and retrying the whole update.
+
+        Parameters
+        ----------
+        endpoint_id : str
+            The uuid of the endpoint
+        add : iterable of str
+            Function ids to add to the whitelist
+        remove : iterable of str
+            Function ids to remove from the whitelist
+        add_chunk_size : int
+            Maximum number of function ids added per request. Default: 500
+
+        Returns
+        -------
+        WhitelistUpdate
+            Named 3-tuple of the function ids ``added`` and ``removed``, in the
+            order given, and ``errors``, a dict of function id to the exception
+            raised by its request
+        """
+        add = [str(fid) for fid in add]
+        remove = [str(fid) for fid in remove]
+        add_chunks = [
+            add[i : i + add_chunk_size] for i in range(0, len(add), add_chunk_size)
+        ]
+
+        def request(op):
+            kind, arg = op
+            if kind == "add":
+                return self.web_client.whitelist_add(endpoint_id, arg)
+            return self.web_client.whitelist_remove(endpoint_id, arg)
+
+        ops = [("add", chunk) for chunk in add_chunks]
+        ops += [("remove", fid) for fid in remove]
+        responses = self._map_whitelist_requests(request, ops)
+
+        added: t.List[str] = []
+        removed: t.List[str] = []
+        errors: t.Dict[str, Exception] = {}
+        for (kind, arg), r in zip(ops, responses):
+            fids = arg if kind == "add" else [arg]
+            if isinstance(r, Exception):
+                logger.debug(f"Whitelist {kind} of {len(fids)} functions failed: {r}")
+                errors.update(dict.fromkeys(fids, r))
+            elif kind == "add":
+                added.extend(fids)
+            else:
+                removed.extend(fids)
+        return WhitelistUpdate(added, removed, errors)
+
     @requires_login
     def stop_endpoint(self, endpoint_id: str):
         """Stop an endpoint by dropping it's active connections.
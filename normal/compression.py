@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import base64
+import logging
+import typing as t
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Marks a compressed payload.  It has the width of the ComputeSerializer method
+# identifiers ("00\n", "01\n", ...) and collides with none of them, so plain and
+# compressed payloads can be told apart from their first bytes.  The header is
+# followed by the codec name and a newline, then the base64 encoded compressed
+# bytes of the original payload.
+COMPRESSED_HEADER = "zz\n"
+
+
+class _Codec(t.NamedTuple):
+    compress: t.Callable[[bytes, int | None], bytes]
+    decompress: t.Callable[[bytes], bytes]
+
+
+def _zlib_codec() -> _Codec:
+    def compress(data: bytes, level: int | None) -> bytes:
+        return zlib.compress(data, -1 if level is None else level)
+
+    return _Codec(compress, zlib.decompress)
+
+
+def _zstd_codec() -> _Codec:
+    import zstandard
+
+    def compress(data: bytes, level: int | None) -> bytes:
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(
+            data
+        )
+
+    def decompress(data: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    return _Codec(compress, decompress)
+
+
+def _lz4_codec() -> _Codec:
+    import lz4.frame
+
+    def compress(data: bytes, level: int | None) -> bytes:
+        return lz4.frame.compress(data, compression_level=level or 0)
+
+    return _Codec(compress, lz4.frame.decompress)
+
+
+_CODEC_LOADERS: dict[str, t.Callable[[], _Codec]] = {
+    "zlib": _zlib_codec,
+    "zstd": _zstd_codec,
+    "lz4": _lz4_codec,
+}
+_codecs: dict[str, _Codec] = {}
+
+
+def get_codec(name: str) -> _Codec:
+    """Return the codec registered under name, importing its package if needed"""
+    codec = _codecs.get(name)
+    if codec is None:
+        try:
+            loader = _CODEC_LOADERS[name]
+        except KeyError:
+            raise ValueError(f"Unknown compression algorithm: {name!r}") from None
+        try:
+            codec = _codecs[name] = loader()
+        except ImportError as e:
+            raise ImportError(
+                f"Compression algorithm {name!r} requires a package that is not "
+                f"installed: {e}"
+            ) from e
+    return codec
+
+
+def available_algorithms() -> list[str]:
+    """Names of the compression algorithms usable in this environment"""
+    names = []
+    for name in _CODEC_LOADERS:
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def is_compressed(payload: str) -> bool:
+    return payload.startswith(COMPRESSED_HEADER)
+
+
+def compress_payload(payload: str, algorithm: str, level: int | None = None) -> str:
+    """Compress a serialized payload, header included"""
+    codec = get_codec(algorithm)
+    compressed = codec.compress(payload.encode("utf-8"), level)
+    encoded = base64.b64encode(compressed).decode("ascii")
+    return f"{COMPRESSED_HEADER}{algorithm}\n{encoded}"
+
+
+def decompress_payload(payload: str) -> str:
+    """Return the original payload of a compressed one; others are returned as is"""
+    if not is_compressed(payload):
+        return payload
+    algorithm, encoded = payload[len(COMPRESSED_HEADER) :].split("\n", 1)
+    codec = get_codec(algorithm)
+    return codec.decompress(base64.b64decode(encoded)).decode("utf-8")
+
+
+class CompressingSerializer:
+    """Proxy around a ComputeSerializer that compresses large payloads
+
+    Data (not function) payloads produced by ``serialize`` of at least
+    ``threshold`` characters are compressed with ``algorithm``, unless that
+    does not make them smaller.  ``deserialize`` recognizes compressed payloads
+    by their header, whichever algorithm produced them, and passes everything
+    else through unchanged, so it reads plain and compressed payloads alike.
+
+    Payloads sent to an endpoint can only be compressed if its workers
+    deserialize through this class (or ``decompress_payload``) as well.
+    """
+
+    def __init__(
+        self,
+        serializer: t.Any,
+        algorithm: str = "zlib",
+        threshold: int = 64 * 1024,
+        level: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        serializer: ComputeSerializer
+            The serializer producing and reading the uncompressed payloads
+
+        algorithm: str
+            "zlib", "zstd" (requires the zstandard package) or "lz4" (requires
+            the lz4 package)
+
+        threshold: int
+            Size, in characters, from which a payload is compressed
+
+        level: int
+            Compression level passed to the codec.  None for its default.
+        """
+        get_codec(algorithm)  # fail early if the codec is not installed
+        self._serializer = serializer
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.level = level
+
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._serializer, name)
+
+    def serialize(self, data: t.Any) -> str:
+        payload = self._serializer.serialize(data)
+        # function code is registered with the service as is
+        if callable(data) or len(payload) < self.threshold:
+            return payload
+        compressed = compress_payload(payload, self.algorithm, self.level)
+        if len(compressed) >= len(payload):
+            logger.debug(f"{self.algorithm} did not shrink a {len(payload)}B payload")
+            return payload
+        self.bytes_in += len(payload)
+        self.bytes_out += len(compressed)
+        return compressed
+
+    def deserialize(self, payload: str) -> t.Any:
+        return self._serializer.deserialize(decompress_payload(payload))
+
+    def unpack_and_deserialize(self, packed_buffer: str) -> list[t.Any]:
+        """ComputeSerializer.unpack_and_deserialize, for compressed buffers too"""
+        unpacked = [
+            self.deserialize(buf)
+            for buf in self._serializer.unpack_buffers(packed_buffer)
+        ]
+        assert len(unpacked) == 3, f"Unpack expects 3 buffers, got {len(unpacked)}"
+        return unpacked
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class StaleWhileRevalidateCache:
+    """TTL cache that serves stale values while refreshing them in the background
+
+    A value younger than ``ttl`` is returned as is.  A value older than ``ttl``
+    but younger than ``max_stale`` is returned immediately, and a refresh is
+    started on a background thread.  Anything older, or missing, is loaded in
+    the calling thread.  At most one refresh per key is in flight at a time.
+    """
+
+    def __init__(self, ttl: float = 5.0, max_stale: float = 60.0):
+        """
+        Parameters
+        ----------
+        ttl: float
+            Seconds during which a value is served without refreshing it
+
+        max_stale: float
+            Seconds after which a value is no longer served, even while a
+            refresh is in flight
+        """
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+
+        self._lock = threading.Lock()
+        self._data: dict[t.Hashable, tuple[float, t.Any]] = {}
+        self._refreshing: set[t.Hashable] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    def get(self, key: t.Hashable, loader: t.Callable[[], t.Any]) -> t.Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                age = now - entry[0]
+                if age < self.ttl:
+                    self.hits += 1
+                    return entry[1]
+                if age < self.max_stale:
+                    self.stale_hits += 1
+                    self._schedule_refresh(key, loader)
+                    return entry[1]
+            self.misses += 1
+
+        value = loader()
+        self._store(key, value)
+        return value
+
+    def _store(self, key: t.Hashable, value: t.Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+
+    def _schedule_refresh(self, key: t.Hashable, loader: t.Callable[[], t.Any]):
+        # caller holds the lock
+        if key in self._refreshing:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="endpoint-cache-refresh"
+            )
+        self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, loader)
+
+    def _refresh(self, key: t.Hashable, loader: t.Callable[[], t.Any]) -> None:
+        try:
+            self._store(key, loader())
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.debug(f"Background refresh of {key} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, predicate: t.Callable[[t.Hashable], bool] | None = None):
+        """Drop cached values; all of them, or those whose key matches"""
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if predicate(k)]:
+                    del self._data[key]
+
+    def close(self) -> None:
+        """Stop the background refresh threads, without waiting for them"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> t.Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refresh_errors": self.refresh_errors,
+            }
@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+import typing as t
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from globus_compute_sdk.serialize import ComputeSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class FakeComputeService:
+    """In-process stand-in for the Globus Compute web service, on localhost
+
+    Implements the routes used by WebClient: submit, tasks, batch_status,
+    taskgroup, functions, endpoints (status, metadata, listing, whitelist) and
+    version.  Nothing is executed: a submitted task completes
+    ``task_duration`` seconds after submission with a canned result, or fails
+    with probability ``task_failure_rate``.  No authentication is checked.
+
+    Use as a context manager, and point a Client at ``url``::
+
+        with FakeComputeService(latency=0.05) as service:
+            web_client = WebClient(base_url=service.url)
+            ...
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_status: int = 503,
+        max_requests_per_second: float | None = None,
+        task_duration: float = 0.0,
+        task_duration_jitter: float = 0.0,
+        task_failure_rate: float = 0.0,
+        result: t.Any = None,
+        total_workers: int = 100,
+        seed: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        host, port: str, int
+            Address to listen on; port 0 picks a free port
+
+        latency: float
+            Seconds added to every response
+
+        latency_jitter: float
+            Up to this many seconds are added at random on top of latency
+
+        failure_rate: float
+            Fraction of requests answered with failure_status instead of being
+            served
+
+        failure_status: int
+            HTTP status of the injected failures
+
+        max_requests_per_second: float
+            Requests beyond this rate are answered with 429.  None for no
+            limit.
+
+        task_duration: float
+            Seconds between the submission and the completion of a task
+
+        task_duration_jitter: float
+            Up to this many seconds are added at random to each task's duration
+
+        task_failure_rate: float
+            Fraction of tasks that complete with an exception
+
+        result: Any
+            Result of every successful task
+
+        total_workers: int
+            Worker count reported by the endpoint status route
+
+        seed: int
+            Seed of the random choices, for repeatable runs
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.max_requests_per_second = max_requests_per_second
+        self.task_duration = task_duration
+        self.task_duration_jitter = task_duration_jitter
+        self.task_failure_rate = task_failure_rate
+        self.total_workers = total_workers
+
+        serializer = ComputeSerializer()
+        self._result = serializer.serialize(result)
+        self._exception = serializer.serialize(RuntimeError("injected task failure"))
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # task_id -> (task_group_id, endpoint_id, completion time, failed)
+        self._tasks: dict[str, tuple[str, str, float, bool]] = {}
+        self._task_groups: dict[str, list[str]] = {}
+        self._functions: set[str] = set()
+        self._whitelists: dict[str, set[str]] = {}
+        self._bucket = max_requests_per_second or 0.0
+        self._bucket_t = time.monotonic()
+        self.requests: dict[str, int] = {}
+        self.injected_failures = 0
+        self.throttled = 0
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self) -> FakeComputeService:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="FakeComputeService", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> FakeComputeService:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "tasks": len(self._tasks),
+                "injected_failures": self.injected_failures,
+                "throttled": self.throttled,
+            }
+
+    # --- request handling -------------------------------------------------
+
+    def _handler_class(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _serve(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, response = service._dispatch(
+                    method, self.path.split("?", 1)[0], body
+                )
+                data = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def do_DELETE(self):
+                self._serve("DELETE")
+
+        return Handler
+
+    _ROUTES = [
+        ("POST", re.compile(r"/v2/submit$"), "_submit"),
+        ("GET", re.compile(r"/v2/tasks/(?P<task_id>[^/]+)$"), "_get_task"),
+        ("POST", re.compile(r"/v2/batch_status$"), "_batch_status"),
+        ("GET", re.compile(r"/v2/taskgroup/(?P<tg_id>[^/]+)$"), "_taskgroup"),
+        ("POST", re.compile(r"/v2/functions$"), "_register_function"),
+        ("GET", re.compile(r"/v2/version$"), "_version"),
+        ("GET", re.compile(r"/v2/endpoints$"), "_endpoints"),
+        ("GET", re.compile(r"/v2/endpoints/(?P<ep_id>[^/]+)$"), "_endpoint"),
+        ("GET", re.compile(r"/v2/endpoints/(?P<ep_id>[^/]+)/status$"), "_status"),
+        ("GET", re.compile(r"/v2/endpoints/(?P<ep_id>[^/]+)/whitelist$"), "_wl_get"),
+        ("POST", re.compile(r"/v2/endpoints/(?P<ep_id>[^/]+)/whitelist$"), "_wl_add"),
+        (
+            "DELETE",
+            re.compile(r"/v2/endpoints/(?P<ep_id>[^/]+)/whitelist/(?P<fn_id>[^/]+)$"),
+            "_wl_remove",
+        ),
+    ]
+
+    def _delay(self) -> None:
+        delay = self.latency
+        if self.latency_jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _admit(self) -> int | None:
+        """Return the status of an injected failure, if this request gets one"""
+        with self._lock:
+            if self.max_requests_per_second:
+                now = time.monotonic()
+                self._bucket = min(
+                    self.max_requests_per_second,
+                    self._bucket
+                    + (now - self._bucket_t) * self.max_requests_per_second,
+                )
+                self._bucket_t = now
+                if self._bucket < 1:
+                    self.throttled += 1
+                    return 429
+                self._bucket -= 1
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                self.injected_failures += 1
+                return self.failure_status
+        return None
+
+    def _dispatch(self, method: str, path: str, body: t.Any) -> tuple[int, t.Any]:
+        self._delay()
+        for route_method, pattern, name in self._ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            return 404, {"error": f"No route for {method} {path}"}
+
+        op = name.lstrip("_")
+        with self._lock:
+            self.requests[op] = self.requests.get(op, 0) + 1
+        failure = self._admit()
+        if failure is not None:
+            return failure, {"error": "injected failure", "code": failure}
+        return 200, getattr(self, name)(body, **match.groupdict())
+
+    def _task_status(self, task_id: str, now: float) -> t.Dict[str, t.Any]:
+        task = self._tasks.get(task_id)
+        if task is None:
+            return {"task_id": task_id, "status": "unknown"}
+        _, _, completion_t, failed = task
+        if now < completion_t:
+            return {"task_id": task_id, "status": "waiting-for-ep"}
+        status: dict[str, t.Any] = {"task_id": task_id, "completion_t": completion_t}
+        if failed:
+            status.update(status="failed", exception=self._exception)
+        else:
+            status.update(status="success", result=self._result)
+        return status
+
+    def _submit(self, body: t.Any) -> t.Dict[str, t.Any]:
+        task_group_id = body.get("task_group_id") or str(uuid.uuid4())
+        now = time.time()
+        results = []
+        with self._lock:
+            group = self._task_groups.setdefault(task_group_id, [])
+            for _function_id, endpoint_id, _payload in body["tasks"]:
+                task_id = str(uuid.uuid4())
+                duration = self.task_duration
+                if self.task_duration_jitter:
+                    duration += self._random.uniform(0, self.task_duration_jitter)
+                failed = self._random.random() < self.task_failure_rate
+                self._tasks[task_id] = (
+                    task_group_id,
+                    endpoint_id,
+                    now + duration,
+                    failed,
+                )
+                group.append(task_id)
+                results.append({"task_uuid": task_id, "http_status_code": 200})
+        return {
+            "response": "success",
+            "task_group_id": task_group_id,
+            "results": results,
+        }
+
+    def _get_task(self, body: t.Any, task_id: str) -> t.Dict[str, t.Any]:
+        with self._lock:
+            return self._task_status(task_id, time.time())
+
+    def _batch_status(self, body: t.Any) -> t.Dict[str, t.Any]:
+        now = time.time()
+        with self._lock:
+            results = {tid: self._task_status(tid, now) for tid in body["task_ids"]}
+        return {"response": "batch", "results": results}
+
+    def _taskgroup(self, body: t.Any, tg_id: str) -> t.Dict[str, t.Any]:
+        with self._lock:
+            task_ids = list(self._task_groups.get(tg_id, []))
+        return {"taskgroup_id": tg_id, "tasks": [{"id": tid} for tid in task_ids]}
+
+    def _register_function(self, body: t.Any) -> t.Dict[str, t.Any]:
+        function_id = str(uuid.uuid4())
+        with self._lock:
+            self._functions.add(function_id)
+        return {"function_uuid": function_id}
+
+    def _version(self, body: t.Any) -> t.Dict[str, t.Any]:
+        return {"api": "1.0.0", "min_sdk_version": "1.0.0", "min_ep_version": "1.0.0"}
+
+    def _endpoint(self, body: t.Any, ep_id: str) -> t.Dict[str, t.Any]:
+        return {"uuid": ep_id, "name": f"fake-{ep_id[:8]}", "status": "online"}
+
+    def _endpoints(self, body: t.Any) -> t.List[t.Dict[str, t.Any]]:
+        with self._lock:
+            endpoint_ids = {task[1] for task in self._tasks.values()}
+        return [self._endpoint(None, ep_id) for ep_id in sorted(endpoint_ids)]
+
+    def _status(self, body: t.Any, ep_id: str) -> t.Dict[str, t.Any]:
+        now = time.time()
+        with self._lock:
+            outstanding = sum(
+                1
+                for _, endpoint_id, completion_t, _ in self._tasks.values()
+                if endpoint_id == ep_id and completion_t > now
+            )
+        return {
+            "status": "online",
+            "details": {
+                "total_workers": self.total_workers,
+                "outstanding_tasks": outstanding,
+            },
+        }
+
+    def _wl_get(self, body: t.Any, ep_id: str) -> t.Dict[str, t.Any]:
+        with self._lock:
+            functions = sorted(self._whitelists.get(ep_id, ()))
+        return {"endpoint_id": ep_id, "functions": functions}
+
+    def _wl_add(self, body: t.Any, ep_id: str) -> t.Dict[str, t.Any]:
+        with self._lock:
+            self._whitelists.setdefault(ep_id, set()).update(body["func"])
+        return {"status": "success", "function_whitelist": body["func"]}
+
+    def _wl_remove(self, body: t.Any, ep_id: str, fn_id: str) -> t.Dict[str, t.Any]:
+        with self._lock:
+            self._whitelists.get(ep_id, set()).discard(fn_id)
+        return {"status": "success", "function_id": fn_id}
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+
+
+class FunctionRegistrationCache:
+    """Local map from registered function content to its function UUID
+
+    Registrations are keyed by a hash of the serialized function body together
+    with its container, entry point, sharing settings, the service address and
+    the login namespace, so that re-registering identical code against the
+    same service, as the same identity, can be answered without a round trip.
+    Identities sharing a ``funcx_home`` never see each other's functions.
+    """
+
+    def __init__(self, path: str, ttl: float | None = None):
+        """
+        Parameters
+        ----------
+        path: str
+            Path of the SQLite database file; created if missing
+
+        ttl: float
+            Seconds after which a cached registration is ignored and the
+            function is registered again.  None for no expiry.
+        """
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS functions ("
+            " key TEXT PRIMARY KEY,"
+            " function_id TEXT NOT NULL,"
+            " registered_t REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        registration: t.Dict[str, t.Any], service_address: str, namespace: str
+    ) -> str:
+        """Hash a function registration payload for the given service and login
+
+        ``namespace`` identifies who registers the function, e.g. the token
+        storage namespace ("user/<env>" or "clientprofile/<env>/<client id>").
+        """
+        blob = json.dumps(
+            {
+                "service": service_address,
+                "namespace": namespace,
+                "registration": registration,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT function_id, registered_t FROM functions WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        function_id, registered_t = row
+        if self.ttl is not None and time.time() - registered_t > self.ttl:
+            return None
+        return function_id
+
+    def put(self, key: str, function_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO functions (key, function_id, registered_t)"
+                " VALUES (?, ?, ?)",
+                (key, function_id, time.time()),
+            )
+            self._conn.commit()
+
+    def invalidate(self, function_id: str | None = None) -> int:
+        """Forget cached registrations
+
+        Parameters
+        ----------
+        function_id: str
+            Only forget registrations that resolved to this function UUID.
+            None forgets everything.
+
+        Returns
+        -------
+        int
+            The number of registrations forgotten
+        """
+        with self._lock:
+            if function_id is None:
+                cur = self._conn.execute("DELETE FROM functions")
+            else:
+                cur = self._conn.execute(
+                    "DELETE FROM functions WHERE function_id = ?", (str(function_id),)
+                )
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import typing as t
+
+from globus_sdk.transport import RetryCheckResult, RetryContext
+
+# upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# web client methods whose calls are measured
+WEB_CLIENT_OPS = frozenset(
+    {
+        "submit",
+        "get_task",
+        "get_batch_status",
+        "get_taskgroup_tasks",
+        "register_function",
+        "get_endpoint_status",
+        "get_endpoint_metadata",
+        "get_endpoints",
+        "get_version",
+        "get_whitelist",
+        "whitelist_add",
+        "whitelist_remove",
+        "register_endpoint",
+        "stop_endpoint",
+        "delete_endpoint",
+    }
+)
+
+
+class LatencyHistogram:
+    """Cumulative histogram of durations, in the Prometheus style"""
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.sum += seconds
+        for i, upper in enumerate(self.buckets):
+            if seconds <= upper:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        out, running = [], 0
+        for upper, n in zip(self.buckets, self.counts):
+            running += n
+            out.append((repr(upper), running))
+        out.append(("+Inf", self.count))
+        return out
+
+    def as_dict(self) -> dict[str, t.Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class ClientMetrics:
+    """Latency, byte and error counters for a Client's service calls
+
+    Service calls and serializer calls are recorded per operation name.
+    Snapshots are available as Prometheus text exposition format
+    (``to_prometheus``) or JSON (``to_json``).
+    """
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.requests: dict[str, LatencyHistogram] = {}
+        self.serialization: dict[str, LatencyHistogram] = {}
+        self.bytes_sent: dict[str, int] = {}
+        self.bytes_received: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self._current_op = threading.local()
+
+    def record_request(self, op: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            hist = self.requests.get(op)
+            if hist is None:
+                hist = self.requests[op] = LatencyHistogram(self.buckets)
+            hist.observe(seconds)
+            if error:
+                self.errors[op] = self.errors.get(op, 0) + 1
+
+    def record_bytes(self, op: str, sent: int, received: int) -> None:
+        with self._lock:
+            self.bytes_sent[op] = self.bytes_sent.get(op, 0) + sent
+            self.bytes_received[op] = self.bytes_received.get(op, 0) + received
+
+    def record_serialization(self, op: str, seconds: float) -> None:
+        with self._lock:
+            hist = self.serialization.get(op)
+            if hist is None:
+                hist = self.serialization[op] = LatencyHistogram(self.buckets)
+            hist.observe(seconds)
+
+    def as_dict(self) -> dict[str, t.Any]:
+        with self._lock:
+            return {
+                "requests": {op: h.as_dict() for op, h in self.requests.items()},
+                "serialization": {
+                    op: h.as_dict() for op, h in self.serialization.items()
+                },
+                "bytes_sent": dict(self.bytes_sent),
+                "bytes_received": dict(self.bytes_received),
+                "errors": dict(self.errors),
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def to_prometheus(self, prefix: str = "globus_compute_client") -> str:
+        snapshot = self.as_dict()
+        lines: list[str] = []
+
+        def histogram(name: str, help_text: str, hists: dict[str, t.Any]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for op, h in sorted(hists.items()):
+                for le, n in h["buckets"].items():
+                    lines.append(f'{prefix}_{name}_bucket{{op="{op}",le="{le}"}} {n}')
+                lines.append(f'{prefix}_{name}_sum{{op="{op}"}} {h["sum"]}')
+                lines.append(f'{prefix}_{name}_count{{op="{op}"}} {h["count"]}')
+
+        def counter(name: str, help_text: str, values: dict[str, int]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for op, n in sorted(values.items()):
+                lines.append(f'{prefix}_{name}{{op="{op}"}} {n}')
+
+        histogram(
+            "request_seconds",
+            "Latency of calls to the Globus Compute web service",
+            snapshot["requests"],
+        )
+        histogram(
+            "serialization_seconds",
+            "Time spent serializing and deserializing",
+            snapshot["serialization"],
+        )
+        counter(
+            "request_sent_bytes_total", "Request body bytes", snapshot["bytes_sent"]
+        )
+        counter(
+            "request_received_bytes_total",
+            "Response body bytes",
+            snapshot["bytes_received"],
+        )
+        counter("request_errors_total", "Failed service calls", snapshot["errors"])
+        return "\n".join(lines) + "\n"
+
+    # the op name of the service call in progress on this thread, used to
+    # attribute byte counts seen by the transport-level response hook
+    @property
+    def current_op(self) -> str | None:
+        return getattr(self._current_op, "name", None)
+
+    @current_op.setter
+    def current_op(self, name: str | None) -> None:
+        self._current_op.name = name
+
+
+class InstrumentedWebClient:
+    """Proxy around a WebClient that records every service call in ClientMetrics"""
+
+    def __init__(self, web_client: t.Any, metrics: ClientMetrics):
+        self._web_client = web_client
+        self._metrics = metrics
+
+        # globus_sdk prepares requests outside of its session, so session hooks
+        # never run; a retry check that makes no decision sees every response
+        transport = getattr(web_client, "transport", None)
+        if isinstance(getattr(transport, "retry_checks", None), list):
+            transport.retry_checks.insert(0, self._observe)
+
+    def _observe(self, ctx: RetryContext) -> RetryCheckResult:
+        response = ctx.response
+        if response is not None:
+            body = getattr(response.request, "body", None) or b""
+            self._metrics.record_bytes(
+                self._metrics.current_op or "other", len(body), len(response.content)
+            )
+        return RetryCheckResult.no_decision
+
+    def __getattr__(self, name: str) -> t.Any:
+        attr = getattr(self._web_client, name)
+        if name not in WEB_CLIENT_OPS or not callable(attr):
+            return attr
+
+        metrics = self._metrics
+
+        def timed(*args, **kwargs):
+            metrics.current_op = name
+            start = time.perf_counter()
+            error = True
+            try:
+                result = attr(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                metrics.record_request(name, time.perf_counter() - start, error)
+                metrics.current_op = None
+
+        return timed
+
+
+class InstrumentedSerializer:
+    """Proxy around a ComputeSerializer that times serialize and deserialize"""
+
+    def __init__(self, serializer: t.Any, metrics: ClientMetrics):
+        self._serializer = serializer
+        self._metrics = metrics
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._serializer, name)
+
+    def serialize(self, data: t.Any) -> str:
+        start = time.perf_counter()
+        try:
+            return self._serializer.serialize(data)
+        finally:
+            self._metrics.record_serialization("serialize", time.perf_counter() - start)
+
+    def deserialize(self, payload: str) -> t.Any:
+        start = time.perf_counter()
+        try:
+            return self._serializer.deserialize(payload)
+        finally:
+            self._metrics.record_serialization(
+                "deserialize", time.perf_counter() - start
+            )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import random
+import time
+import typing as t
+
+
+class PollScheduler:
+    """Delay schedule for polling the service for task results
+
+    Delays back off exponentially while polls report no completed tasks and
+    drop back to the floor as soon as one does.  Once task completions have
+    been observed, the floor and ceiling follow the typical gap between
+    completions (from the tasks' ``completion_t``), so a stream of quick tasks
+    is polled eagerly while tasks that sit queued for minutes are polled a few
+    times per completion rather than ten times a second.  The ceiling also
+    grows with the time since the last completion was observed, so that a
+    past burst of quick tasks does not keep polls frequent once completions
+    stop.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        max_interval: float = 30.0,
+        factor: float = 2.0,
+        jitter: float = 0.5,
+        deadline: float | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        min_interval: float
+            Lower bound for any delay, in seconds
+
+        max_interval: float
+            Upper bound for any delay, in seconds
+
+        factor: float
+            Multiplier applied to the delay after a poll without progress
+
+        jitter: float
+            Fraction of each delay above the floor that is randomized, in [0, 1]
+
+        deadline: float
+            ``time.monotonic()`` value after which no more delays are granted
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+        self.deadline = deadline
+
+        self._delay = min_interval
+        self._gap: float | None = None
+        self._last_completion_t: float | None = None
+        # time.monotonic() of the last observed completion
+        self._last_observed: float | None = None
+
+    def observe(self, completion_t: t.Any) -> None:
+        """Record the ``completion_t`` of a finished task"""
+        try:
+            ct = float(completion_t)
+        except (TypeError, ValueError):
+            return
+        if self._last_completion_t is not None:
+            gap = abs(ct - self._last_completion_t)
+            # exponentially weighted moving average of inter-completion gaps
+            self._gap = gap if self._gap is None else 0.8 * self._gap + 0.2 * gap
+        self._last_completion_t = ct
+        self._last_observed = time.monotonic()
+
+    @property
+    def floor(self) -> float:
+        if self._gap is None:
+            return self.min_interval
+        return min(max(self._gap / 4, self.min_interval), self.max_interval)
+
+    @property
+    def ceiling(self) -> float:
+        if self._gap is None or self._last_observed is None:
+            return self.max_interval
+        idle = time.monotonic() - self._last_observed
+        return min(max(self._gap * 4, idle, self.floor), self.max_interval)
+
+    def remaining(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def next_delay(self, progress: bool) -> float:
+        """Return how long to sleep before the next poll
+
+        Parameters
+        ----------
+        progress: bool
+            Whether the last poll reported any completed tasks
+        """
+        if progress:
+            self._delay = self.floor
+        else:
+            self._delay = min(max(self._delay * self.factor, self.floor), self.ceiling)
+
+        floor = self.floor
+        delay = floor + (self._delay - floor) * (1 - self.jitter * random.random())
+        remaining = self.remaining()
+        if remaining is not None:
+            delay = min(delay, remaining)
+        return delay
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+
+from globus_sdk.transport import RetryCheckResult, RetryContext
+
+logger = logging.getLogger(__name__)
+
+# web client methods that take a token from the limiter: task submission and
+# status requests, which are the ones sent in bursts
+RATE_LIMITED_OPS = frozenset(
+    {"submit", "get_task", "get_batch_status", "get_taskgroup_tasks"}
+)
+
+# response codes with which the service tells clients to slow down
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds; HTTP dates are ignored"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket pacing requests to the service, adapting to throttling
+
+    Every request takes a token; tokens are added at ``rate`` per second, up to
+    a burst capacity.  A caller that finds the bucket empty reserves the next
+    token and sleeps until it is due, so waiting callers are served in order
+    and the limiter never wakes more of them than the rate allows.
+
+    The rate follows the service's feedback, additive increase and
+    multiplicative decrease: each throttled response (429 or 503) cuts it by
+    ``backoff``, at most once per ``cooldown`` seconds so that the responses to
+    one burst count once, and honours any Retry-After delay; each successful
+    response raises it again, by about ``recovery`` requests/s per second of
+    traffic, up to the configured rate.
+
+    A limiter is thread-safe and can be shared by several clients, including
+    AsyncClients (see ``acquire_async``).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        min_rate: float | None = None,
+        backoff: float = 0.5,
+        recovery: float | None = None,
+        cooldown: float = 1.0,
+    ):
+        """
+        Parameters
+        ----------
+        rate: float
+            Maximum number of requests per second
+
+        burst: float
+            Number of requests that can be sent at once after a quiet period,
+            at the maximum rate; the capacity shrinks with the current rate.
+            Default: one second's worth of requests
+
+        min_rate: float
+            Rate below which throttling does not push the limiter.
+            Default: a hundredth of rate
+
+        backoff: float
+            Factor applied to the rate on a throttled response, in (0, 1)
+
+        recovery: float
+            Requests/s regained per second of successful traffic.
+            Default: a twentieth of rate
+
+        cooldown: float
+            Minimum seconds between two rate decreases
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(float(burst if burst is not None else rate), 1.0)
+        self.min_rate = min_rate if min_rate is not None else rate / 100
+        self.backoff = backoff
+        self.recovery = recovery if recovery is not None else rate / 20
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        # may go negative: tokens reserved by callers sleeping until they are due
+        self._tokens = self.burst
+        self._last_t = time.monotonic()
+        self._last_decrease_t = -float("inf")
+
+        self.acquired = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.throttled: dict[int, int] = {}
+        self.decreases = 0
+
+    @property
+    def capacity(self) -> float:
+        return max(self.burst * self.rate / self.max_rate, 1.0)
+
+    def _refill(self, now: float) -> None:
+        # caller holds the lock
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last_t) * self.rate
+        )
+        self._last_t = now
+
+    def _reserve(self, tokens: float, timeout: float | None) -> float:
+        """Take tokens, returning how long the caller must wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(tokens - self._tokens, 0.0) / self.rate
+            if timeout is not None and wait > timeout:
+                raise TimeoutError(f"No request slot within {timeout}s")
+            self._tokens -= tokens
+            self.acquired += 1
+            if wait > 0:
+                self.delayed += 1
+                self.wait_seconds += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0, timeout: float | None = None) -> float:
+        """Block until a request may be sent; returns the seconds waited
+
+        Raises TimeoutError, without taking any token, if that would take
+        longer than ``timeout`` seconds.
+        """
+        wait = self._reserve(tokens, timeout)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(
+        self, tokens: float = 1.0, timeout: float | None = None
+    ) -> float:
+        """Like acquire, but waits without blocking the event loop"""
+        import asyncio
+
+        wait = self._reserve(tokens, timeout)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """Record a response that was not throttled"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.recovery / self.rate)
+
+    def on_throttle(self, status: int, retry_after: float | None = None) -> None:
+        """Record a throttled response, slowing down the following requests"""
+        with self._lock:
+            self.throttled[status] = self.throttled.get(status, 0) + 1
+            now = time.monotonic()
+            if now - self._last_decrease_t >= self.cooldown:
+                self._last_decrease_t = now
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate * self.backoff)
+                self.decreases += 1
+                logger.debug(f"Throttled ({status}); rate now {self.rate:.2f}/s")
+            if retry_after:
+                # no token is due before the service is willing to hear from us
+                self._refill(now)
+                self._tokens = min(self._tokens, -retry_after * self.rate)
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "max_rate": self.max_rate,
+                "acquired": self.acquired,
+                "delayed": self.delayed,
+                "wait_seconds": self.wait_seconds,
+                "throttled": dict(self.throttled),
+                "decreases": self.decreases,
+            }
+
+
+class RateLimitedWebClient:
+    """Proxy around a WebClient that paces submission and status calls
+
+    Calls in RATE_LIMITED_OPS first take a token from the limiter.  The
+    limiter learns of throttling from every HTTP response, including those
+    the web client's transport retries on its own: it is fed by a retry check
+    that makes no decision, registered ahead of the transport's own.
+    """
+
+    def __init__(self, web_client: t.Any, limiter: RateLimiter):
+        self._web_client = web_client
+        self._limiter = limiter
+
+        transport = getattr(web_client, "transport", None)
+        self._observing = isinstance(getattr(transport, "retry_checks", None), list)
+        if self._observing:
+            transport.retry_checks.insert(0, self._observe)
+
+    def _observe(self, ctx: RetryContext) -> RetryCheckResult:
+        response = ctx.response
+        if response is not None:
+            if response.status_code in THROTTLE_STATUSES:
+                self._limiter.on_throttle(
+                    response.status_code,
+                    retry_after_seconds(response.headers.get("Retry-After")),
+                )
+            elif response.status_code < 400:
+                self._limiter.on_success()
+        return RetryCheckResult.no_decision
+
+    def __getattr__(self, name: str) -> t.Any:
+        attr = getattr(self._web_client, name)
+        if name not in RATE_LIMITED_OPS or not callable(attr):
+            return attr
+
+        limiter = self._limiter
+        observing = self._observing
+
+        def limited(*args, **kwargs):
+            limiter.acquire()
+            if observing:
+                return attr(*args, **kwargs)
+            # without a transport to observe, learn from the outcome of the call
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                status = getattr(e, "http_status", None)
+                if status in THROTTLE_STATUSES:
+                    limiter.on_throttle(status)
+                raise
+            limiter.on_success()
+            return result
+
+        return limited
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+from concurrent.futures import Future
+
+import globus_sdk
+
+from .polling import PollScheduler
+
+if t.TYPE_CHECKING:
+    from .client import Client
+
+logger = logging.getLogger(__name__)
+
+
+class ResultPoller:
+    """Resolves Futures of submitted tasks from one background polling thread
+
+    Every task tracked by the poller is included in the same batch status
+    requests (paged by the client's ``batch_status_page_size``), so the number
+    of requests does not grow with the number of Futures being waited on.
+    Polls are spaced by a PollScheduler; newly tracked tasks bring the next
+    poll forward to the scheduler's floor, never closer.
+
+    A Future resolves to the task's result, or to the exception raised while
+    unpacking it (typically TaskExecutionFailed).  Cancelled Futures are
+    dropped at the next poll.  Failed polls are retried, except when the login
+    has expired: no login flow is started from the polling thread, the Futures
+    being polled fail with the AuthAPIError instead.
+    """
+
+    def __init__(
+        self, client: Client, min_interval: float = 0.1, max_interval: float = 10.0
+    ):
+        """
+        Parameters
+        ----------
+        client: Client
+            The client whose batch status requests are used
+
+        min_interval: float
+            Minimum delay between polls, in seconds
+
+        max_interval: float
+            Maximum delay between polls, in seconds
+        """
+        self.client = client
+        self._scheduler = PollScheduler(
+            min_interval=min_interval, max_interval=max_interval
+        )
+
+        self._cond = threading.Condition()
+        # task_id -> the Futures waiting on it
+        self._waiters: dict[str, list[Future]] = {}
+        self._next_poll = 0.0
+        self._closed = False
+
+        self.polls = 0
+        self.poll_failures = 0
+        self.resolved = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="ResultPoller", daemon=True
+        )
+        self._thread.start()
+
+    def track(self, task_id: str, future: Future | None = None) -> Future:
+        """Resolve future (a new one by default) with the result of task_id"""
+        if future is None:
+            future = Future()
+        future.task_id = task_id  # type: ignore[attr-defined]
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot track tasks on a closed ResultPoller")
+            self._waiters.setdefault(task_id, []).append(future)
+            self._next_poll = min(
+                self._next_poll, time.monotonic() + self._scheduler.floor
+            )
+            self._cond.notify_all()
+        return future
+
+    def _resolve(self, task_id: str, futures: list[Future], value: t.Any) -> None:
+        for future in futures:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+        self.resolved += 1
+
+    def _poll(self, task_ids: list[str]) -> bool:
+        """Poll task_ids once; returns whether any of them completed"""
+        client = self.client
+        finished: list[tuple[str, t.Any]] = []
+
+        for task_id, status in client._lookup_completed(task_ids).items():
+            finished.append((task_id, status))
+        known = {task_id for task_id, _ in finished}
+        pending = [task_id for task_id in task_ids if task_id not in known]
+
+        if pending:
+            try:
+                status_data = client._request_batch_status(pending)
+            except globus_sdk.AuthAPIError as e:
+                self.poll_failures += 1
+                logger.warning(f"Polling {len(pending)} tasks failed, login needed")
+                finished.extend((task_id, e) for task_id in pending)
+                status_data = {}
+            except Exception as e:
+                self.poll_failures += 1
+                logger.warning(f"Polling {len(pending)} tasks failed: {e}")
+                status_data = {}
+            else:
+                self.polls += 1
+            for task_id, data in status_data.items():
+                try:
+                    status = client._update_task_table(data, task_id)
+                except Exception as e:
+                    self._scheduler.observe(getattr(e, "completion_t", None))
+                    finished.append((task_id, e))
+                    continue
+                if status["pending"] is False:
+                    self._scheduler.observe(status.get("completion_t"))
+                    finished.append((task_id, status))
+
+        for task_id, status in finished:
+            with self._cond:
+                futures = self._waiters.pop(task_id, [])
+            if not futures:
+                continue
+            if not isinstance(status, Exception):
+                try:
+                    status = client._deserialize_result(status)["result"]
+                except Exception as e:
+                    status = e
+            self._resolve(task_id, futures, status)
+        return bool(finished)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    # forget tasks whose Futures have all been cancelled
+                    for task_id in list(self._waiters):
+                        live = [f for f in self._waiters[task_id] if not f.cancelled()]
+                        if live:
+                            self._waiters[task_id] = live
+                        else:
+                            del self._waiters[task_id]
+                    if self._closed:
+                        return
+                    remaining = self._next_poll - time.monotonic()
+                    if self._waiters and remaining <= 0:
+                        break
+                    self._cond.wait(remaining if self._waiters else None)
+                task_ids = list(self._waiters)
+
+            progress = self._poll(task_ids)
+
+            with self._cond:
+                delay = self._scheduler.next_delay(progress=progress)
+                self._next_poll = time.monotonic() + delay
+
+    def pending(self) -> int:
+        """Number of tasks with Futures still waiting on them"""
+        with self._cond:
+            return len(self._waiters)
+
+    def stats(self) -> t.Dict[str, int]:
+        return {
+            "pending": self.pending(),
+            "polls": self.polls,
+            "poll_failures": self.poll_failures,
+            "resolved": self.resolved,
+        }
+
+    def close(self) -> None:
+        """Stop the background thread, cancelling the Futures still waiting"""
+        with self._cond:
+            self._closed = True
+            waiters, self._waiters = self._waiters, {}
+            self._cond.notify_all()
+        self._thread.join()
+        for futures in waiters.values():
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_MAX_VARIABLES = 500
+
+
+class ResultStore:
+    """On-disk store of completed task results, backed by SQLite
+
+    Results are kept serialized, exactly as returned by the service, so that a
+    restarted client can answer for completed tasks without a network call.
+    Once the stored payloads exceed ``max_bytes`` the least recently accessed
+    results are evicted, down to ``low_water`` of it, so that evictions are
+    batched rather than run on every put.  The pages they free are returned
+    to the filesystem a little at a time (incremental auto-vacuum, for
+    databases created by this class); ``compact`` runs a full VACUUM.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int | None = 4 * 1024 * 1024 * 1024,
+        low_water: float = 0.9,
+    ):
+        """
+        Parameters
+        ----------
+        path: str
+            Path of the SQLite database file; created if missing
+
+        max_bytes: int
+            Maximum total size of stored result payloads.  None for no limit.
+
+        low_water: float
+            Fraction of ``max_bytes`` down to which results are evicted once
+            the limit is exceeded
+        """
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        # only takes effect when the database is created
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " task_id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " completion_t TEXT,"
+            " payload TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " accessed_t REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_t)"
+        )
+        self._conn.commit()
+        # kept as a running total from here on; results stored by other
+        # processes sharing the file are counted when it is opened again
+        self.total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+        self._page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+
+    def get(self, task_id: str) -> tuple[str, str, str] | None:
+        """Return (status, completion_t, payload) for a task, or None"""
+        return self.get_many([task_id]).get(task_id)
+
+    def get_many(self, task_ids: t.Sequence[str]) -> dict[str, tuple[str, str, str]]:
+        """Return (status, completion_t, payload) for the stored tasks among
+        ``task_ids``, keyed by task id"""
+        found: dict[str, tuple[str, str, str]] = {}
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(task_ids), _MAX_VARIABLES):
+                chunk = list(task_ids[i : i + _MAX_VARIABLES])
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT task_id, status, completion_t, payload FROM results"
+                    f" WHERE task_id IN ({marks})",
+                    chunk,
+                ).fetchall()
+                for task_id, status, completion_t, payload in rows:
+                    found[task_id] = (status, completion_t, payload)
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE results SET accessed_t = ? WHERE task_id = ?",
+                        [(now, row[0]) for row in rows],
+                    )
+            if found:
+                self._conn.commit()
+        return found
+
+    def put(self, task_id: str, status: str, completion_t: str, payload: str) -> None:
+        size = len(payload)
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM results WHERE task_id = ?", (task_id,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results"
+                " (task_id, status, completion_t, payload, size, accessed_t)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (task_id, status, completion_t, payload, size, time.time()),
+            )
+            self.total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, task_id: str) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size FROM results WHERE task_id = ?", (task_id,)
+            ).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM results WHERE task_id = ?", (task_id,))
+                self.total_bytes -= row[0]
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        if self.max_bytes is None or self.total_bytes <= self.max_bytes:
+            return
+        excess = self.total_bytes - int(self.max_bytes * self.low_water)
+        evicted = 0
+        cursor = self._conn.execute(
+            "SELECT task_id, size FROM results ORDER BY accessed_t"
+        )
+        doomed = []
+        for task_id, size in cursor:
+            doomed.append((task_id,))
+            evicted += size
+            if evicted >= excess:
+                break
+        cursor.close()
+        self._conn.executemany("DELETE FROM results WHERE task_id = ?", doomed)
+        self.total_bytes -= evicted
+        logger.debug(f"Evicted {len(doomed)} results ({evicted} bytes) from store")
+        # release about as many free pages as were just freed; a no-op for
+        # databases created without incremental auto-vacuum
+        pages = evicted // self._page_size + 1
+        self._conn.execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+
+    def compact(self) -> None:
+        """Reclaim all the disk space of evicted results with a full VACUUM
+
+        This rewrites the whole database file; run it outside of any polling.
+        """
+        with self._lock:
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
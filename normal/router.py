@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+if t.TYPE_CHECKING:
+    from .batch import Batch
+    from .client import Client
+
+logger = logging.getLogger(__name__)
+
+
+class EndpointRouter:
+    """Spreads the tasks of a Batch across several endpoints
+
+    Each endpoint is weighted by its free capacity, from the
+    ``total_workers`` and ``outstanding_tasks`` reported by
+    ``Client.get_endpoint_status``, divided by the observed task turnaround
+    time on that endpoint.  Endpoints that are not online get no tasks.
+
+    Turnaround times are learned from results fetched through the router's
+    ``get_batch_result`` or fed in with ``observe``.  Submissions awaiting an
+    observation are remembered up to ``max_tracked`` tasks, the oldest being
+    forgotten first.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        endpoint_ids: t.Sequence[str],
+        latency_alpha: float = 0.2,
+        default_latency: float = 1.0,
+        max_tracked: int = 100_000,
+    ):
+        """
+        Parameters
+        ----------
+        client: Client
+            The client used to query endpoints and submit batches.  Enabling its
+            endpoint cache (endpoint_cache_ttl) keeps routing decisions cheap.
+
+        endpoint_ids: sequence of str
+            UUIDs of the endpoints to route to
+
+        latency_alpha: float
+            Weight of the newest observation in the per-endpoint moving
+            average of turnaround times
+
+        default_latency: float
+            Turnaround time, in seconds, assumed for endpoints without
+            observations
+
+        max_tracked: int
+            Maximum number of submitted tasks remembered until their completion
+            is observed
+        """
+        if not endpoint_ids:
+            raise ValueError("EndpointRouter needs at least one endpoint")
+        self.client = client
+        self.endpoint_ids = [str(e) for e in endpoint_ids]
+        self.latency_alpha = latency_alpha
+        self.default_latency = default_latency
+        self.max_tracked = max_tracked
+
+        self._lock = threading.Lock()
+        self._latency: dict[str, float] = {}
+        # task_id -> (endpoint_id, submission time), oldest first
+        self._submitted: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def weights(self) -> dict[str, float]:
+        """Return the current routing weight of each endpoint"""
+        weights = {}
+        for endpoint_id in self.endpoint_ids:
+            try:
+                status = self.client.get_endpoint_status(endpoint_id)
+            except Exception as e:
+                logger.warning(f"Unable to get status of endpoint {endpoint_id}: {e}")
+                weights[endpoint_id] = 0.0
+                continue
+            if status.get("status") != "online":
+                weights[endpoint_id] = 0.0
+                continue
+            details = status.get("details") or {}
+            workers = details.get("total_workers") or 0
+            outstanding = details.get("outstanding_tasks") or 0
+            free = max(workers - outstanding, 0)
+            with self._lock:
+                latency = self._latency.get(endpoint_id, self.default_latency)
+            # +1 so that saturated endpoints still drain a trickle of work
+            weights[endpoint_id] = (free + 1) / max(latency, 1e-3)
+        return weights
+
+    @staticmethod
+    def _allocate(weights: dict[str, float], n: int) -> list[str]:
+        """Assign n slots to endpoints in proportion to their weights
+
+        Uses smooth weighted round robin, so consecutive tasks are interleaved
+        across endpoints rather than handed out in blocks.
+        """
+        total = sum(weights.values())
+        current = {e: 0.0 for e in weights}
+        order = []
+        for _ in range(n):
+            for e, w in weights.items():
+                current[e] += w
+            chosen = max(current, key=current.__getitem__)
+            current[chosen] -= total
+            order.append(chosen)
+        return order
+
+    def spread(self, batch: Batch) -> dict[str, int]:
+        """Reassign the endpoint of every task in the batch
+
+        Returns
+        -------
+        dict
+            Number of tasks assigned to each endpoint
+        """
+        weights = {e: w for e, w in self.weights().items() if w > 0}
+        if not weights:
+            raise RuntimeError("None of the routed endpoints is online")
+
+        assignment = self._allocate(weights, len(batch.tasks))
+        batch.tasks = [
+            (function_id, endpoint_id, payload)
+            for (function_id, _, payload), endpoint_id in zip(batch.tasks, assignment)
+        ]
+        counts = {e: 0 for e in self.endpoint_ids}
+        for endpoint_id in assignment:
+            counts[endpoint_id] += 1
+        logger.debug(f"Routed {len(assignment)} tasks: {counts}")
+        return counts
+
+    def batch_run(self, batch: Batch) -> t.List[str]:
+        """Spread the batch across the endpoints and submit it"""
+        self.spread(batch)
+        endpoints = [endpoint_id for _, endpoint_id, _ in batch.tasks]
+        task_ids = self.client.batch_run(batch)
+        now = time.time()
+        with self._lock:
+            for task_id, endpoint_id in zip(task_ids, endpoints):
+                self._submitted[task_id] = (endpoint_id, now)
+            # tasks polled without the router are never observed
+            while len(self._submitted) > self.max_tracked:
+                self._submitted.popitem(last=False)
+        return task_ids
+
+    def observe(self, task_id: str, completion_t: t.Any) -> None:
+        """Record the completion time of a task submitted through the router"""
+        with self._lock:
+            submitted = self._submitted.pop(task_id, None)
+            if submitted is None:
+                return
+            endpoint_id, submit_t = submitted
+            try:
+                latency = max(float(completion_t) - submit_t, 0.0)
+            except (TypeError, ValueError):
+                return
+            old = self._latency.get(endpoint_id)
+            if old is None:
+                self._latency[endpoint_id] = latency
+            else:
+                alpha = self.latency_alpha
+                self._latency[endpoint_id] = alpha * latency + (1 - alpha) * old
+
+    def get_batch_result(self, task_id_list: t.List[str], **kwargs) -> t.Dict:
+        """Client.get_batch_result, learning turnaround times from the results"""
+        results = self.client.get_batch_result(task_id_list, **kwargs)
+        for task_id, status in results.items():
+            if status.get("pending") is False:
+                self.observe(task_id, status.get("completion_t"))
+        # failed tasks are left out of the results and will never be observed
+        missing = [task_id for task_id in task_id_list if task_id not in results]
+        if missing:
+            with self._lock:
+                for task_id in missing:
+                    self._submitted.pop(task_id, None)
+        return results
+
+    def latencies(self) -> dict[str, float]:
+        """Return the observed turnaround time of each endpoint"""
+        with self._lock:
+            return dict(self._latency)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+from collections import deque
+from concurrent.futures import Future
+
+if t.TYPE_CHECKING:
+    from .batch import Batch
+    from .client import Client
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingSubmitter:
+    """Buffers individual task submissions and sends them as batches
+
+    Each call to ``submit`` adds the task to the current Batch and returns a
+    Future that resolves to the task's UUID once the batch has been sent.  The
+    batch is sent as by ``Client.batch_run`` when it holds ``max_batch_size``
+    tasks or when its oldest task has waited ``max_delay`` seconds, whichever
+    comes first.  No login flow is started from the background thread: if the
+    login has expired, the batch's Futures fail with the AuthAPIError.
+    """
+
+    def __init__(
+        self, client: Client, max_batch_size: int = 100, max_delay: float = 0.05
+    ):
+        """
+        Parameters
+        ----------
+        client: Client
+            The client whose batch_run sends the batches
+
+        max_batch_size: int
+            Number of buffered tasks that triggers an immediate flush
+
+        max_delay: float
+            Longest time, in seconds, a task is buffered before being sent
+        """
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._batch: Batch | None = None
+        self._futures: list[Future] = []
+        self._first_t = 0.0
+        # full batches waiting for the background thread
+        self._ready: deque[tuple[Batch, list[Future]]] = deque()
+        self._in_flight = 0
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name="CoalescingSubmitter", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        function_id: str,
+        endpoint_id: str,
+        args: tuple[t.Any, ...] | None = None,
+        kwargs: dict[str, t.Any] | None = None,
+    ) -> Future:
+        """Buffer a task; returns a Future resolving to its task UUID"""
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed CoalescingSubmitter")
+            if self._batch is None:
+                self._batch = self.client.create_batch()
+                self._first_t = time.monotonic()
+            self._batch.add(function_id, endpoint_id, args, kwargs)
+            self._futures.append(future)
+            if len(self._futures) >= self.max_batch_size:
+                self._seal()
+                self._cond.notify_all()
+            elif len(self._futures) == 1:
+                self._cond.notify_all()
+        return future
+
+    def _seal(self) -> None:
+        # move the current batch to the ready queue; caller holds the lock
+        if self._batch is not None:
+            self._ready.append((self._batch, self._futures))
+            self._in_flight += 1
+        self._batch, self._futures = None, []
+
+    @staticmethod
+    def _resolve(future: Future, value: t.Any) -> None:
+        # callers may have cancelled their Future while it was buffered
+        if not future.set_running_or_notify_cancel():
+            return
+        if isinstance(value, Exception):
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+
+    def _send(self, batch: Batch, futures: list[Future]) -> None:
+        try:
+            # not batch_run: an expired login fails the Futures with the
+            # AuthAPIError instead of starting a login flow on this thread
+            task_ids = self.client._batch_run(batch)
+        except Exception as e:
+            logger.debug(f"Coalesced batch of {len(futures)} tasks failed: {e}")
+            # batch_run reports which tasks did make it when only some failed
+            partial = getattr(e, "task_uuids", None) or [None] * len(futures)
+            for future, task_id in zip(futures, partial):
+                self._resolve(future, e if task_id is None else task_id)
+        else:
+            for future, task_id in zip(futures, task_ids):
+                self._resolve(future, task_id)
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._ready:
+                    if self._futures:
+                        remaining = self._first_t + self.max_delay - time.monotonic()
+                        if remaining <= 0 or self._closed:
+                            self._seal()
+                            break
+                        self._cond.wait(remaining)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+                batch, futures = self._ready.popleft()
+            try:
+                self._send(batch, futures)
+            except Exception:
+                # never let one batch stop the thread the others depend on
+                logger.exception(f"Coalesced batch of {len(futures)} tasks failed")
+
+    def flush(self) -> None:
+        """Send any buffered tasks now and wait until every batch has been sent"""
+        with self._cond:
+            self._seal()
+            self._cond.notify_all()
+            while self._in_flight:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Send buffered tasks and stop the background thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+
+class TaskStatusCache:
+    """Bounded LRU + TTL cache for task status blocks
+
+    Used as the Client's task status table.  Entries are evicted in least
+    recently used order once either the entry count or the accounted result
+    size exceeds its limit, and lazily once they are older than ``ttl``.  A
+    result larger than the whole size limit is not cached at all, rather than
+    flushing every other entry.
+
+    Pending status blocks are not kept: a task missing from the table is
+    pending as far as the client knows, and polling many pending tasks must
+    not evict completed results that have not been read yet.  Only completed
+    tasks count toward the limits.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 100_000,
+        max_result_bytes: int | None = 512 * 1024 * 1024,
+        ttl: float | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        max_entries: int
+            Maximum number of task status blocks to keep.  None for no limit.
+
+        max_result_bytes: int
+            Maximum total size, in bytes, of the result payloads held in the
+            cache.  None for no limit.
+
+        ttl: float
+            Seconds after which an entry expires.  None for no expiry.
+        """
+        self.max_entries = max_entries
+        self.max_result_bytes = max_result_bytes
+        self.ttl = ttl
+
+        self._data: OrderedDict[str, tuple[float, int, t.Dict]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.result_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.oversize = 0
+
+    def _expired(self, stored_t: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_t > self.ttl
+
+    def _drop(self, task_id: str) -> None:
+        _, size, _ = self._data.pop(task_id)
+        self.result_bytes -= size
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (
+                self.max_result_bytes is not None
+                and self.result_bytes > self.max_result_bytes
+            )
+        ):
+            task_id = next(iter(self._data))
+            self._drop(task_id)
+            self.evictions += 1
+
+    def get(self, task_id: str, default: t.Any = None) -> t.Any:
+        with self._lock:
+            entry = self._data.get(task_id)
+            if entry is None:
+                self.misses += 1
+                return default
+            if self._expired(entry[0], time.monotonic()):
+                self._drop(task_id)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(task_id)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, task_id: str, status: t.Dict, size: int = 0) -> None:
+        """Store a status block, accounting ``size`` bytes against the limit"""
+        with self._lock:
+            if task_id in self._data:
+                self._drop(task_id)
+            if status.get("pending", False):
+                return
+            if self.max_result_bytes is not None and size > self.max_result_bytes:
+                self.oversize += 1
+                return
+            self._data[task_id] = (time.monotonic(), size, status)
+            self.result_bytes += size
+            self._evict()
+
+    def __setitem__(self, task_id: str, status: t.Dict) -> None:
+        self.set(task_id, status)
+
+    def __getitem__(self, task_id: str) -> t.Dict:
+        status = self.get(task_id, None)
+        if status is None:
+            raise KeyError(task_id)
+        return status
+
+    def __contains__(self, task_id: object) -> bool:
+        with self._lock:
+            entry = self._data.get(task_id)  # type: ignore[call-overload]
+            return entry is not None and not self._expired(entry[0], time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, task_id: str, default: t.Any = None) -> t.Any:
+        with self._lock:
+            if task_id not in self._data:
+                return default
+            status = self._data[task_id][2]
+            self._drop(task_id)
+            return status
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.result_bytes = 0
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry; returns the number of entries dropped"""
+        if self.ttl is None:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            # entries are refreshed on set only, so the oldest are not
+            # necessarily at the front; walk the whole table
+            expired = [
+                task_id
+                for task_id, (stored_t, _, _) in self._data.items()
+                if self._expired(stored_t, now)
+            ]
+            for task_id in expired:
+                self._drop(task_id)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def stats(self) -> t.Dict[str, int]:
+        """Return the hit/miss/eviction counters and current occupancy"""
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "result_bytes": self.result_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "oversize": self.oversize,
+            }
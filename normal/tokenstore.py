@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import contextlib
 import json
+import logging
 import os
 import pathlib
 import getpass
+import random
+import sqlite3
 import tempfile
+import threading
+import time
+import typing as t
+import weakref
 
 from globus_sdk.tokenstorage import SQLiteAdapter
 
@@ -12,6 +20,8 @@ from .._environments import _get_envname
 from .client_login import get_client_login, is_client_login
 from .globus_auth import internal_auth_client
 
+log = logging.getLogger(__name__)
+
 
 def _home() -> pathlib.Path:
     # this is a hook point for tests to patch over
@@ -88,6 +98,169 @@ def _resolve_namespace(environment: str | None) -> str:
     return f"user/{env}"
 
 
+class _ConnectionPool:
+    """The SQLite connections of one process to one database, one per thread
+
+    Connections are shared by every adapter of the database in the process.
+    Each thread gets its own, so that readers never wait on one another in
+    WAL mode; connections of threads that have exited are closed when new
+    ones are made.  A forked child starts a fresh pool.
+
+    A ``shared`` pool instead hands the same connection to every thread, and
+    its ``lock`` serializes their use of it: an in-memory database only exists
+    within the connection that created it.
+    """
+
+    def __init__(
+        self,
+        dbname: str,
+        connect: t.Callable[[], sqlite3.Connection],
+        shared: bool = False,
+    ):
+        self.dbname = dbname
+        self.pid = os.getpid()
+        self.users = 0
+        self.shared = shared
+        self.lock: t.ContextManager[t.Any] = (
+            threading.RLock() if shared else contextlib.nullcontext()
+        )
+        self._connect = connect
+        self._lock = threading.Lock()
+        # thread ident -> (connection, {namespace: (data_version, tokens)})
+        self._slots: dict[int, tuple[sqlite3.Connection, dict[str, t.Any]]] = {}
+
+    def slot(self) -> tuple[sqlite3.Connection, dict[str, t.Any]]:
+        if self.shared:
+            return next(iter(self._slots.values()))
+        ident = threading.get_ident()
+        slot = self._slots.get(ident)
+        if slot is None:
+            with self._lock:
+                alive = {th.ident for th in threading.enumerate()}
+                for dead in [i for i in self._slots if i not in alive]:
+                    self._slots.pop(dead)[0].close()
+                slot = self._slots[ident] = (self._connect(), {})
+        return slot
+
+    def adopt(self, conn: sqlite3.Connection) -> None:
+        """Use an already open connection for the current thread"""
+        with self._lock:
+            self._slots[threading.get_ident()] = (conn, {})
+
+    def close(self) -> None:
+        with self._lock:
+            for conn, _ in self._slots.values():
+                conn.close()
+            self._slots.clear()
+
+
+_pools: dict[str, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+class ConcurrentSQLiteAdapter(SQLiteAdapter):
+    """SQLiteAdapter for token storage shared by many threads and processes
+
+    Compared to SQLiteAdapter, it
+
+    - waits up to ``busy_timeout`` seconds for a lock held by another process
+      instead of failing,
+    - optionally puts the database in WAL mode, so that readers proceed while
+      a writer commits,
+    - reuses one connection per thread, shared by all adapters in the process
+      (for ":memory:", one connection shared by the threads of this adapter),
+    - keeps the tokens read in memory, and serves them until another
+      connection changes the database (as reported by ``PRAGMA data_version``).
+
+    WAL mode relies on shared memory between the processes using the database
+    and does not work on network filesystems, hence it is off by default.
+    """
+
+    def __init__(
+        self,
+        dbname: pathlib.Path | str,
+        *,
+        namespace: str = "DEFAULT",
+        connect_params: dict[str, t.Any] | None = None,
+        busy_timeout: float = 30.0,
+        wal: bool = False,
+    ) -> None:
+        self.filename = self.dbname = str(dbname)
+        self.namespace = namespace
+        self.busy_timeout = busy_timeout
+        self.wal = wal
+        self._connect_params = dict(connect_params or {})
+        self._connect_params["check_same_thread"] = False
+        self._connect_params.setdefault("timeout", busy_timeout)
+
+        with _pools_lock:
+            pool = _pools.get(self.dbname)
+            if pool is None or pool.pid != os.getpid() or self._is_memory_db():
+                pool = _ConnectionPool(
+                    self.dbname, self._connect, shared=self._is_memory_db()
+                )
+                # creates the tables when the database is new
+                pool.adopt(
+                    self._configure(self._init_and_connect(self._connect_params))
+                )
+                if not self._is_memory_db():
+                    _pools[self.dbname] = pool
+            pool.users += 1
+        self._pool = pool
+
+    def _configure(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        if self.wal and not self._is_memory_db():
+            conn.execute("PRAGMA journal_mode = WAL")
+            # durable at checkpoints rather than at every commit; safe in WAL
+            conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        return self._configure(sqlite3.connect(self.dbname, **self._connect_params))
+
+    @property
+    def _connection(self) -> sqlite3.Connection:  # type: ignore[override]
+        return self._pool.slot()[0]
+
+    def close(self) -> None:
+        with _pools_lock:
+            self._pool.users -= 1
+            if self._pool.users > 0:
+                return
+            if _pools.get(self.dbname) is self._pool:
+                del _pools[self.dbname]
+        self._pool.close()
+
+    def _forget(self) -> None:
+        # this thread's own writes do not change its connection's data_version
+        self._pool.slot()[1].pop(self.namespace, None)
+
+    def get_by_resource_server(self) -> dict[str, t.Any]:
+        with self._pool.lock:
+            conn, cache = self._pool.slot()
+            (version,) = conn.execute("PRAGMA data_version").fetchone()
+            cached = cache.get(self.namespace)
+            if cached is None or cached[0] != version:
+                tokens = super().get_by_resource_server()
+                cached = cache[self.namespace] = (version, tokens)
+            return {rs: dict(data) for rs, data in cached[1].items()}
+
+    def get_token_data(self, resource_server: str) -> dict[str, t.Any] | None:
+        return self.get_by_resource_server().get(resource_server)
+
+    def store(self, token_response) -> None:
+        with self._pool.lock:
+            super().store(token_response)
+            self._forget()
+
+    def remove_tokens_for_resource_server(self, resource_server: str) -> bool:
+        with self._pool.lock:
+            removed = super().remove_tokens_for_resource_server(resource_server)
+            self._forget()
+            return removed
+
+
 def get_token_storage_adapter(*, environment: str | None = None) -> SQLiteAdapter:
     # when initializing the token storage adapter, check if the storage file exists
     # if it does not, then use this as a flag to clean the old config
@@ -95,8 +268,165 @@ def get_token_storage_adapter(*, environment: str | None = None) -> SQLiteAdapte
     if not os.path.exists(fname):
         invalidate_old_config()
     # namespace is equal to the current environment
-    return SQLiteAdapter(
+    # WAL is opt-in, as it does not work on network filesystems
+    return ConcurrentSQLiteAdapter(
         fname,
         namespace=_resolve_namespace(environment),
-        connect_params={"check_same_thread": False},
+        wal=os.environ.get("FUNCX_TOKEN_STORAGE_WAL", "") in ("1", "true", "yes"),
     )
+
+
+class TokenRefresher:
+    """Renews access tokens in the background, shortly before they expire
+
+    Authorizers (globus_sdk RenewingAuthorizers) are registered per resource
+    server.  A daemon thread watches the expiry of each resource server's
+    token in the storage adapter.  When a token is within ``lead_time``
+    seconds of expiring, the thread renews it through one of the authorizers,
+    stores the new token, and publishes it to every registered authorizer, so
+    no request waits on a renewal.  A token renewed by another process is
+    picked up from storage and published without contacting Globus Auth.
+
+    Each authorizer gets the new token before the new expiry time, so a
+    concurrent request sees either the old token, which is still valid, or the
+    new one.
+    """
+
+    def __init__(
+        self,
+        storage: SQLiteAdapter,
+        lead_time: float = 300.0,
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+    ):
+        """
+        Parameters
+        ----------
+        storage: SQLiteAdapter
+            Token storage shared with the login manager
+
+        lead_time: float
+            Seconds before expiry at which a token is renewed.  Each process
+            picks a random point in the last quarter of this window, so that
+            processes sharing the storage do not all renew at once.
+
+        min_interval: float
+            Shortest time, in seconds, between two checks, or between retries
+            after a failed renewal
+
+        max_interval: float
+            Longest time, in seconds, between two checks of the storage
+        """
+        self.storage = storage
+        self.lead_time = lead_time * random.uniform(0.75, 1.0)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self._cond = threading.Condition()
+        self._authorizers: dict[str, weakref.WeakSet] = {}
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+        self.refreshes = 0
+        self.adopted = 0
+        self.failures = 0
+
+    def register(self, authorizer: t.Any, resource_server: str) -> None:
+        """Keep the authorizer's token fresh; it is held by weak reference"""
+        if not hasattr(authorizer, "_get_token_response"):
+            log.debug(f"Not a renewing authorizer, not refreshed: {authorizer!r}")
+            return
+        with self._cond:
+            self._authorizers.setdefault(resource_server, weakref.WeakSet()).add(
+                authorizer
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="TokenRefresher", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    @staticmethod
+    def _publish(authorizers: t.Iterable[t.Any], token_data: dict) -> None:
+        for authorizer in authorizers:
+            if authorizer.expires_at == token_data["expires_at_seconds"]:
+                continue
+            # token first: the old token is valid until its own expiry
+            authorizer.access_token = token_data["access_token"]
+            authorizer.expires_at = token_data["expires_at_seconds"]
+
+    def _refresh(self, resource_server: str, authorizers: list[t.Any]) -> float:
+        """Bring one resource server's token up to date; returns its expiry"""
+        stored = self.storage.get_token_data(resource_server)
+        current = max((a.expires_at or 0 for a in authorizers), default=0)
+        if stored and stored["expires_at_seconds"] > current:
+            self._publish(authorizers, stored)
+            self.adopted += 1
+            current = stored["expires_at_seconds"]
+
+        if current - time.time() > self.lead_time:
+            return current
+
+        authorizer = authorizers[0]
+        res = authorizer._get_token_response()
+        token_data = authorizer._extract_token_data(res)
+        if callable(authorizer.on_refresh):
+            authorizer.on_refresh(res)
+        self._publish(authorizers, token_data)
+        self.refreshes += 1
+        log.debug(f"Renewed the access token for {resource_server}")
+        return token_data["expires_at_seconds"]
+
+    def _check(self) -> float:
+        """Refresh what needs it; returns the time of the next check"""
+        with self._cond:
+            groups = {
+                rs: list(auths) for rs, auths in self._authorizers.items() if auths
+            }
+
+        wake_at = time.time() + self.max_interval
+        for resource_server, authorizers in groups.items():
+            try:
+                expires_at = self._refresh(resource_server, authorizers)
+            except Exception as e:
+                self.failures += 1
+                log.warning(f"Token renewal for {resource_server} failed: {e}")
+                expires_at = time.time() + self.lead_time + self.min_interval
+            wake_at = min(wake_at, expires_at - self.lead_time)
+        return wake_at
+
+    def _run(self) -> None:
+        while True:
+            # the authorizers are only referenced strongly inside _check
+            wake_at = self._check()
+            with self._cond:
+                if self._stopped:
+                    return
+                self._cond.wait(max(wake_at - time.time(), self.min_interval))
+                if self._stopped:
+                    return
+
+
+_refreshers: dict[tuple[str, str], TokenRefresher] = {}
+_refreshers_lock = threading.Lock()
+
+
+def get_token_refresher(storage: SQLiteAdapter, **kwargs) -> TokenRefresher:
+    """Return the process's TokenRefresher for the storage's database and namespace
+
+    Keyword arguments are passed to TokenRefresher when it is created.
+    """
+    key = (storage.dbname, storage.namespace)
+    with _refreshers_lock:
+        refresher = _refreshers.get(key)
+        if refresher is None:
+            refresher = _refreshers[key] = TokenRefresher(storage, **kwargs)
+        return refresher
@@ -0,0 +1,53 @@
+from globus_compute_sdk.serialize import ComputeSerializer
+
+from normal.arg_store import DedupSerializer, DirectoryArgStore
+
+
+def make_serializer(tmp_path):
+    store = DirectoryArgStore(str(tmp_path / "args"))
+    return DedupSerializer(ComputeSerializer(), store, threshold=1024)
+
+
+def roundtrip(serializer, args):
+    # deserializing resolves the references, as on the worker
+    return serializer.deserialize(serializer.serialize(args))
+
+
+def test_mutated_argument_is_stored_again(tmp_path):
+    serializer = make_serializer(tmp_path)
+    config = {"lr": 0.1, "weights": list(range(1000))}
+
+    first = roundtrip(serializer, (config,))
+    config["lr"] = 0.5
+    second = roundtrip(serializer, (config,))
+
+    assert first[0]["lr"] == 0.1
+    assert second[0]["lr"] == 0.5
+    assert serializer.stats()["uploads"] == 2
+
+
+def test_unchanged_argument_is_deduplicated(tmp_path):
+    serializer = make_serializer(tmp_path)
+    config = {"lr": 0.1, "weights": list(range(1000))}
+
+    serializer.serialize((config,))
+    serializer.serialize((config,))
+
+    stats = serializer.stats()
+    assert stats["uploads"] == 1
+    assert stats["refs_created"] == 2
+    assert stats["bytes_deduplicated"] > 0
+
+
+def test_immutable_argument_reuses_reference(tmp_path):
+    serializer = make_serializer(tmp_path)
+    blob = b"x" * 4096
+
+    assert roundtrip(serializer, (blob,)) == (blob,)
+    assert roundtrip(serializer, (blob,)) == (blob,)
+
+    # the second call is answered by identity, without serializing the blob
+    stats = serializer.stats()
+    assert stats["uploads"] == 1
+    assert stats["refs_created"] == 1
+    assert stats["bytes_deduplicated"] > 4096
@@ -0,0 +1,43 @@
+from normal.task_cache import TaskStatusCache
+
+
+def completed(payload: str) -> dict:
+    return {"pending": False, "status": "success", "payload": payload}
+
+
+def test_polling_pending_tasks_keeps_completed_results():
+    cache = TaskStatusCache(max_entries=100)
+    for i in range(50):
+        cache.set(f"done-{i}", completed("x" * 10), size=10)
+
+    # one status poll over more pending tasks than the cache holds
+    for i in range(200):
+        cache.set(f"pending-{i}", {"pending": True, "status": "waiting-for-ep"})
+
+    assert all(f"done-{i}" in cache for i in range(50))
+    assert "pending-0" not in cache
+    stats = cache.stats()
+    assert stats["evictions"] == 0
+    assert stats["entries"] == 50
+    assert stats["result_bytes"] == 500
+
+
+def test_completed_results_are_evicted_lru():
+    cache = TaskStatusCache(max_entries=2)
+    cache.set("a", completed("a"), size=1)
+    cache.set("b", completed("b"), size=1)
+    cache.get("a")
+    cache.set("c", completed("c"), size=1)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_task_turning_pending_again_is_forgotten():
+    cache = TaskStatusCache()
+    cache.set("a", completed("a"), size=1)
+    cache.set("a", {"pending": True, "status": "running"})
+
+    assert "a" not in cache
+    assert cache.stats()["result_bytes"] == 0